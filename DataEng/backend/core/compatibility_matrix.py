@@ -3,7 +3,8 @@ Compatibility Matrix for AntiGravity DataEng
 Defines all compatibility rules between providers across categories.
 """
 
-from typing import Dict, List, Set, Optional
+import functools
+from typing import Dict, FrozenSet, List, Set, Optional, Tuple
 
 
 # =============================================================================
@@ -237,6 +238,9 @@ def is_compatible(provider1_cat: str, provider1: str, provider2_cat: str, provid
     """
     Check if two providers are compatible.
     
+    Answered from the precomputed bitmask tables: one dict lookup per side
+    and a bit test, instead of re-evaluating the rules in the matrix.
+    
     Args:
         provider1_cat: Category of first provider (e.g., "ingestion")
         provider1: Name of first provider (e.g., "DLT")
@@ -246,6 +250,17 @@ def is_compatible(provider1_cat: str, provider1: str, provider2_cat: str, provid
     Returns:
         True if compatible, False otherwise
     """
+    bit = _BIT.get(provider2_cat, {}).get(provider2)
+    masks = _COMPAT.get((provider1_cat, provider2_cat))
+    if bit is None or masks is None:
+        return False
+    return bool(masks.get(provider1, 0) >> bit & 1)
+
+
+def _evaluate_compatibility(
+    provider1_cat: str, provider1: str, provider2_cat: str, provider2: str
+) -> bool:
+    """Apply the matrix rules to one provider pair (used to build the bitmasks)."""
     info1 = get_provider_info(provider1_cat, provider1)
     info2 = get_provider_info(provider2_cat, provider2)
     
@@ -277,6 +292,43 @@ def is_compatible(provider1_cat: str, provider1: str, provider2_cat: str, provid
     return True  # Default to compatible if no rules found
 
 
+# =============================================================================
+# PRECOMPUTED BITMASKS
+# =============================================================================
+# Each provider gets a bit index within its category (_BIT). For every
+# category pair, _COMPAT maps a provider of the first category to a mask of
+# compatible providers in the second, and _COMPAT_REVERSE maps a provider of
+# the second category to a mask of compatible providers in the first.
+
+_BIT: Dict[str, Dict[str, int]] = {}
+_COMPAT: Dict[Tuple[str, str], Dict[str, int]] = {}
+_COMPAT_REVERSE: Dict[Tuple[str, str], Dict[str, int]] = {}
+
+
+def _build_bitmasks() -> None:
+    _BIT.clear()
+    _COMPAT.clear()
+    _COMPAT_REVERSE.clear()
+    
+    for category, providers in COMPATIBILITY_MATRIX.items():
+        _BIT[category] = {provider: i for i, provider in enumerate(providers)}
+    
+    for cat_a, bits_a in _BIT.items():
+        for cat_b, bits_b in _BIT.items():
+            forward = dict.fromkeys(bits_a, 0)
+            reverse = dict.fromkeys(bits_b, 0)
+            for prov_a, bit_a in bits_a.items():
+                for prov_b, bit_b in bits_b.items():
+                    if _evaluate_compatibility(cat_a, prov_a, cat_b, prov_b):
+                        forward[prov_a] |= 1 << bit_b
+                        reverse[prov_b] |= 1 << bit_a
+            _COMPAT[(cat_a, cat_b)] = forward
+            _COMPAT_REVERSE[(cat_a, cat_b)] = reverse
+
+
+_build_bitmasks()
+
+
 def get_compatible_providers(category: str, current_stack: Dict[str, str]) -> List[str]:
     """
     Get list of compatible providers for a category given current stack.
@@ -288,19 +340,30 @@ def get_compatible_providers(category: str, current_stack: Dict[str, str]) -> Li
     Returns:
         List of compatible provider names
     """
-    all_providers = list(COMPATIBILITY_MATRIX.get(category, {}).keys())
-    compatible = []
+    # Order of the stack does not matter, so a frozenset makes a stable cache key
+    return list(_compatible_providers(category, frozenset(current_stack.items())))
+
+
+@functools.lru_cache(maxsize=256)
+def _compatible_providers(
+    category: str, current_items: FrozenSet[Tuple[str, str]]
+) -> Tuple[str, ...]:
+    bits = _BIT.get(category, {})
+    mask = (1 << len(bits)) - 1
     
-    for provider in all_providers:
-        is_compat = True
-        
-        # Check against all selected providers in stack
-        for selected_cat, selected_prov in current_stack.items():
-            if not is_compatible(category, provider, selected_cat, selected_prov):
-                is_compat = False
-                break
-        
-        if is_compat:
-            compatible.append(provider)
+    # AND together the masks of providers compatible with each selection
+    for selected_cat, selected_prov in current_items:
+        reverse = _COMPAT_REVERSE.get((category, selected_cat))
+        if reverse is None:
+            return ()
+        mask &= reverse.get(selected_prov, 0)
+        if not mask:
+            return ()
     
-    return compatible
+    return tuple(provider for provider, bit in bits.items() if mask >> bit & 1)
+
+
+def clear_caches() -> None:
+    """Rebuild the compatibility tables and drop memoized lookups (e.g. after a matrix edit)."""
+    _build_bitmasks()
+    _compatible_providers.cache_clear()
@@ -6,7 +6,7 @@ Foundation for deploying AntiGravity projects to cloud providers.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
@@ -24,12 +24,12 @@ class DeploymentStatus(Enum):
 @dataclass
 class DeploymentResult:
     """Result of a deployment operation"""
-    status: Deployment Status
+    status: DeploymentStatus
     message: str
     endpoints: Dict[str, str]
     resources: Dict[str, str]
     errors: List[str]
-    
+
     def is_success(self) -> bool:
         return self.status == DeploymentStatus.SUCCESS
 
@@ -37,44 +37,44 @@ class DeploymentResult:
 class CloudDeployer(ABC):
     """
     Abstract base class for cloud deployers.
-    
+
     Each cloud provider (AWS, GCP, Azure) implements this interface.
     """
-    
+
     def __init__(self, project_path: Path, environment: str = "prod"):
         """
         Initialize deployer.
-        
+
         Args:
             project_path: Path to AntiGravity project
             environment: Target environment (dev/staging/prod)
         """
         self.project_path = Path(project_path)
         self.environment = environment
-        
+
         if not self.project_path.exists():
             raise FileNotFoundError(f"Project not found: {project_path}")
-    
+
     @abstractmethod
     def validate_credentials(self) -> bool:
         """Validate cloud credentials are configured"""
         pass
-    
+
     @abstractmethod
     def deploy(self, **kwargs) -> DeploymentResult:
         """Deploy the project to cloud"""
         pass
-    
+
     @abstractmethod
     def destroy(self) -> DeploymentResult:
         """Destroy deployed resources"""
         pass
-    
+
     @abstractmethod
     def status(self) -> Dict:
         """Get deployment status"""
         pass
-    
+
     def _load_project_config(self) -> Dict:
         """Load project configuration"""
         from core.updater import ProjectMetadata
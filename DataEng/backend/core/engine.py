@@ -1,10 +1,11 @@
+import functools
 import os
 import shutil
 import yaml
 import zipfile
 import io
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, TemplateError
 from typing import Dict, Any, Optional
 
 from core.registry import ProviderRegistry
@@ -17,6 +18,9 @@ from core.template_context_builder import TemplateContextBuilder
 from core.env_manager import EnvironmentManager
 from core.updater import ProjectMetadata
 
+# O_BINARY only exists on Windows, where it stops CRLF translation
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
 
 class VirtualFileSystem:
     """
@@ -31,6 +35,10 @@ class VirtualFileSystem:
         """Add a file to the virtual filesystem"""
         self.files[path] = content
     
+    def add_files(self, mapping: Dict[str, str]) -> None:
+        """Add several files at once (path -> content)"""
+        self.files.update(mapping)
+    
     def get_file(self, path: str) -> Optional[str]:
         """Get file content by path"""
         return self.files.get(path)
@@ -39,6 +47,17 @@ class VirtualFileSystem:
         """List all file paths in the VFS"""
         return list(self.files.keys())
     
+    def file_contains(self, path: str, *needles: str) -> bool:
+        """True if the file exists and its content contains any of the needles"""
+        content = self.files.get(path)
+        if content is None:
+            return False
+        return any(needle in content for needle in needles)
+    
+    def contains_all(self, paths) -> bool:
+        """True if every one of the given paths is in the VFS"""
+        return self.files.keys() >= set(paths)
+    
     def flush(self, output_dir: str) -> str:
         """
         Write all files from VFS to disk.
@@ -49,18 +68,51 @@ class VirtualFileSystem:
         Returns:
             Path to the output directory
         """
+        for path, content in self._prepare_output(output_dir).items():
+            self._write_one(path, content)
+        
+        return output_dir
+    
+    def _prepare_output(self, output_dir: str) -> Dict[str, str]:
+        """
+        Recreate output_dir and all parent directories for the VFS files.
+        
+        Directories are created in a single deduplicated, sorted pass, so
+        writers only open and write files.
+        
+        Returns:
+            Mapping of absolute file path to content
+        """
         if os.path.exists(output_dir):
             shutil.rmtree(output_dir)
         os.makedirs(output_dir)
         
-        for file_path, content in self.files.items():
-            full_path = os.path.join(output_dir, file_path)
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+        full_paths = {
+            os.path.join(output_dir, file_path): content
+            for file_path, content in self.files.items()
+        }
+        for directory in sorted({os.path.dirname(path) for path in full_paths}):
+            os.makedirs(directory, exist_ok=True)
         
-        return output_dir
+        return full_paths
+    
+    @staticmethod
+    def _write_one(path: str, content: str) -> None:
+        """
+        Write a single file as UTF-8 bytes through one raw file descriptor.
+        
+        Newlines are translated to os.linesep first, matching what a
+        text-mode open(path, 'w') would write.
+        """
+        if os.linesep != "\n":
+            content = content.replace("\n", os.linesep)
+        data = memoryview(content.encode('utf-8'))
+        fd = os.open(path, _WRITE_FLAGS, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
     
     def to_zip(self, output_path: str) -> str:
         """
@@ -72,10 +124,7 @@ class VirtualFileSystem:
         Returns:
             Path to the created ZIP file
         """
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path, content in self.files.items():
-                zipf.writestr(file_path, content)
-        
+        self._write_zip(output_path)
         return output_path
     
     def to_bytes_zip(self) -> bytes:
@@ -87,17 +136,46 @@ class VirtualFileSystem:
             ZIP file contents as bytes
         """
         zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        self._write_zip(zip_buffer)
+        return zip_buffer.getvalue()
+    
+    def _write_zip(self, target) -> None:
+        """
+        Write every VFS file into a ZIP archive at target (path or file object).
+        
+        Deflate level 1: generated files are small text, where higher levels
+        cost CPU for only a few percent smaller archives.
+        """
+        with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
             for file_path, content in self.files.items():
                 zipf.writestr(file_path, content)
-        
-        return zip_buffer.getvalue()
+
+
+@functools.lru_cache(maxsize=None)
+def _template_environment(template_dir: str) -> Environment:
+    """
+    One Jinja2 Environment per template directory, shared by every
+    TemplateEngine so the loader and compiled-template cache stay warm.
+    
+    Every template is compiled up front, so the get_template calls made
+    while generating are cache hits. auto_reload stays on, so template
+    edits are still picked up by a long-running process.
+    """
+    env = Environment(loader=FileSystemLoader(template_dir))
+    for name in env.list_templates(extensions=["j2"]):
+        try:
+            env.get_template(name)
+        except TemplateError:
+            # Left uncached; get_template raises it again when it is used
+            pass
+    return env
+
 
 class TemplateEngine:
     def __init__(self, template_dir: str = "templates"):
         base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.template_dir = os.path.join(base_path, template_dir)
-        self.env = Environment(loader=FileSystemLoader(self.template_dir))
+        self.env = _template_environment(self.template_dir)
 
     def generate(self, project_name: str, stack: dict, project_id: str) -> VirtualFileSystem:
         """
@@ -288,13 +366,15 @@ class TemplateEngine:
                 with tempfile.TemporaryDirectory() as temp_dir:
                     generator.generate(temp_dir, config={"project_context": context})
                     
-                    # Read generated files into VFS
+                    # Read generated files, then add them to the VFS in one go
+                    component_files = {}
                     for root, dirs, files in os.walk(temp_dir):
                         for file in files:
                             file_path = os.path.join(root, file)
                             rel_path = os.path.relpath(file_path, temp_dir)
                             with open(file_path, 'r', encoding='utf-8') as f:
-                                vfs.add_file(rel_path, f.read())
+                                component_files[rel_path] = f.read()
+                    vfs.add_files(component_files)
                 
                 # Merge Docker Compose services
                 services = generator.get_docker_service_definition(context)
@@ -348,12 +428,11 @@ class TemplateEngine:
         
         # 7. Generate multi-environment .env files
         env_files = EnvironmentManager.generate_all_env_files(context)
-        for env_name, env_content in env_files.items():
-            if env_name == "example":
-                vfs.add_file(".env.example", env_content)
-            else:
-                vfs.add_file(f".env.{env_name}", env_content)
-            print(f"  ✓ Generated .env.{env_name if env_name != 'example' else 'example'}")
+        vfs.add_files({
+            f".env.{env_name}": env_content for env_name, env_content in env_files.items()
+        })
+        for env_name in env_files:
+            print(f"  ✓ Generated .env.{env_name}")
         
         # 8. Add environment switcher script
         switcher_script = EnvironmentManager.generate_env_switcher_script()
@@ -371,7 +450,7 @@ class TemplateEngine:
             stack=stack,
             version="1.0.0"
         )
-        metadata_content = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
+        metadata_content = ProjectMetadata.dumps(metadata)
         vfs.add_file(".antigravity.yml", metadata_content)
         print("  ✓ Generated .antigravity.yml (update metadata)")
         
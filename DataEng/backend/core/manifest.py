@@ -132,18 +132,18 @@ class ProjectContext(BaseModel):
         """
         Returns an existing secret for the given key, or generates a new one.
         """
-        if key not in self.generated_secrets:
-            self.generated_secrets[key] = secrets.token_urlsafe(length)
-        return self.generated_secrets[key]
+        # One dict lookup on a hit; the token is only generated on a miss
+        secret = self.generated_secrets.get(key)
+        if secret is None:
+            secret = self.generated_secrets[key] = secrets.token_urlsafe(length)
+        return secret
 
     def get_service_port(self, service_name: str, default: int) -> int:
         """
         Returns the port for a service.
         TODO: specific logic to avoid collisions could be added here.
         """
-        if service_name not in self.base_ports:
-            self.base_ports[service_name] = default
-        return self.base_ports[service_name]
+        return self.base_ports.setdefault(service_name, default)
     
     def register_connection(self, conn: ServiceConnection) -> None:
         """
@@ -12,6 +12,25 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
+
+def _dump_json(data: dict) -> bytes:
+    """Serialize a profile as indented JSON (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _load_json(raw: bytes) -> dict:
+    """Parse a profile JSON document (orjson when installed)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 @dataclass
 class StackProfile:
@@ -183,8 +202,7 @@ class ConfigurationProfile:
                 tags=tags
             )
         
-        with open(profile_path, 'w') as f:
-            json.dump(profile.to_dict(), f, indent=2)
+        profile_path.write_bytes(_dump_json(profile.to_dict()))
         
         return profile
     
@@ -211,9 +229,7 @@ class ConfigurationProfile:
         if not profile_path.exists():
             raise FileNotFoundError(f"Profile '{name}' not found")
         
-        with open(profile_path) as f:
-            data = json.load(f)
-            return StackProfile.from_dict(data)
+        return StackProfile.from_dict(_load_json(profile_path.read_bytes()))
     
     @classmethod
     def delete(cls, name: str) -> bool:
@@ -321,8 +337,7 @@ class ConfigurationProfile:
         """
         profile = cls.load(name)
         
-        with open(output_path, 'w') as f:
-            json.dump(profile.to_dict(), f, indent=2)
+        Path(output_path).write_bytes(_dump_json(profile.to_dict()))
     
     @classmethod
     def import_profile(cls, input_path: Path, overwrite: bool = False) -> StackProfile:
@@ -336,9 +351,7 @@ class ConfigurationProfile:
         Returns:
             Imported StackProfile
         """
-        with open(input_path) as f:
-            data = json.load(f)
-            profile = StackProfile.from_dict(data)
+        profile = StackProfile.from_dict(_load_json(Path(input_path).read_bytes()))
         
         return cls.save(
             name=profile.name,
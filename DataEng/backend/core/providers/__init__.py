@@ -4,6 +4,10 @@ Core providers package.
 This module must be imported to trigger provider registration.
 """
 
+import functools
+import importlib
+import pkgutil
+
 # Import all providers to trigger registration with ProviderRegistry
 from . import ingestion
 from . import ingestion_extended  # Additional ingestion providers (Airbyte)
@@ -35,6 +39,22 @@ __all__ = [
     'orchestration_mage',
     'infrastructure',
     'visualization',
-   'quality',
-    'monitoring'
+    'quality',
+    'monitoring',
+    'load_all'
 ]
+
+
+@functools.cache
+def load_all():
+    """
+    Import every provider module in this package in a single pass.
+    
+    Picks up modules not listed above as well. Subpackages (e.g. sources)
+    are opt-in and skipped. Cached, so repeated calls are free.
+    """
+    return [
+        importlib.import_module(f"{__name__}.{module.name}")
+        for module in pkgutil.iter_modules(__path__)
+        if not module.ispkg
+    ]
@@ -1,4 +1,5 @@
-from typing import Dict, Type
+import functools
+from typing import Dict, Tuple, Type
 from core.interfaces import ComponentGenerator
 
 class ProviderRegistry:
@@ -18,9 +19,17 @@ class ProviderRegistry:
         if category not in cls._registry:
             raise ValueError(f"Invalid category: {category}")
         cls._registry[category][name] = provider_cls
+        cls.invalidate()
         
     @classmethod
+    @functools.cache
     def get_provider(cls, category: str, name: str) -> Type[ComponentGenerator]:
+        """
+        Returns the provider class registered under (category, name).
+        
+        Hits are memoized until the registry changes; misses raise
+        ValueError every time and are never cached.
+        """
         if category not in cls._registry:
             raise ValueError(f"Invalid category: {category}")
         
@@ -35,8 +44,25 @@ class ProviderRegistry:
         """
         Returns a dictionary of all registered providers, categorized.
         Structure: { "ingestion": ["ToolA", "ToolB"], "storage": [...] }
+        
+        Each call returns a fresh dict the caller may modify; the provider
+        names behind it are cached until the registry changes.
         """
         return {
-            category: list(tools.keys())
+            category: list(tools)
+            for category, tools in cls._provider_names().items()
+        }
+    
+    @classmethod
+    @functools.cache
+    def _provider_names(cls) -> Dict[str, Tuple[str, ...]]:
+        return {
+            category: tuple(tools.keys())
             for category, tools in cls._registry.items()
         }
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop the cached provider names and provider lookups (called on register)."""
+        cls._provider_names.cache_clear()
+        cls.get_provider.cache_clear()
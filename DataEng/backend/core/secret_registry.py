@@ -13,10 +13,29 @@ from dataclasses import dataclass, field
 # SECRET GENERATION UTILITIES
 # =============================================================================
 
+PASSWORD_ALPHABET = string.ascii_letters + string.digits + "!@#$%^&*"
+
+# Random bytes at or above this limit are rejected so every character of
+# the alphabet stays equally likely (largest multiple of its size <= 256)
+_PASSWORD_BYTE_LIMIT = 256 - 256 % len(PASSWORD_ALPHABET)
+
+
 def generate_secure_password(length: int = 16) -> str:
-    """Generate a secure random password."""
-    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    """
+    Generate a secure random password.
+    
+    Random bytes are drawn in one batch per password (instead of one
+    os.urandom read per character) and mapped onto PASSWORD_ALPHABET.
+    """
+    alphabet_size = len(PASSWORD_ALPHABET)
+    chars: List[str] = []
+    while len(chars) < length:
+        chars.extend(
+            PASSWORD_ALPHABET[byte % alphabet_size]
+            for byte in secrets.token_bytes(2 * length)
+            if byte < _PASSWORD_BYTE_LIMIT
+        )
+    return ''.join(chars[:length])
 
 
 def generate_secret_key(length: int = 32) -> str:
@@ -4,7 +4,7 @@ Validates stack configurations for compatibility and provides suggestions.
 """
 
 from typing import Dict, List, Tuple, Optional
-from backend.core.compatibility_matrix import (
+from core.compatibility_matrix import (
     COMPATIBILITY_MATRIX,
     is_compatible,
     get_compatible_providers,
@@ -8,12 +8,33 @@ Templates are loaded from multiple sources with priority:
 2. Default templates (backend/templates/)
 """
 
+import functools
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 from jinja2 import Environment, FileSystemLoader, ChoiceLoader
 import shutil
 
 
+def _tree_signature(path: Path) -> Optional[Tuple[Tuple[str, int], ...]]:
+    """
+    Modification times of path and of each directory directly inside it,
+    or None if path does not exist.
+    
+    Adding or removing a template in any category directory changes the
+    result, at the cost of a single scandir of path.
+    """
+    try:
+        root_mtime_ns = path.stat().st_mtime_ns
+        with os.scandir(path) as entries:
+            categories = sorted(
+                (entry.name, entry.stat().st_mtime_ns) for entry in entries if entry.is_dir()
+            )
+    except FileNotFoundError:
+        return None
+    return (("", root_mtime_ns), *categories)
+
+
 class TemplateLoader:
     """
     Multi-source template loader.
@@ -44,12 +65,26 @@ class TemplateLoader:
         """
         Create Jinja2 environment with multiple loaders.
         
+        Environments are cached per directory list and the modification
+        times of the user template directory and its category directories,
+        so adding or removing user templates from outside this class also
+        yields a fresh environment. Edits to existing template files are picked up by Jinja2's own
+        auto_reload. Callers share one instance and should not mutate it
+        (filters, globals).
+        
         Returns:
             Jinja2 Environment configured with ChoiceLoader
         """
+        return self._build_env(tuple(self.all_dirs), _tree_signature(self.USER_TEMPLATES))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _build_env(
+        template_dirs: Tuple[Path, ...], user_signature: Optional[Tuple[Tuple[str, int], ...]]
+    ) -> Environment:
         loaders = []
         
-        for template_dir in self.all_dirs:
+        for template_dir in template_dirs:
             if template_dir.exists():
                 loaders.append(FileSystemLoader(str(template_dir)))
         
@@ -70,7 +105,7 @@ class TemplateLoader:
         cls,
         category: str,
         filename: str,
-        source_path: Path
+        source: Union[Path, bytes]
     ) -> Path:
         """
         Override a default template with a custom one.
@@ -78,21 +113,35 @@ class TemplateLoader:
         Args:
             category: Template category (e.g., 'orchestration', 'transformation')
             filename: Template filename
-            source_path: Path to the custom template file
+            source: Path to the custom template file, or the template
+                content itself as bytes
         
         Returns:
             Path where template was saved
+        
+        Raises:
+            TypeError: If source is a str, which could be either a path or
+                content; pass Path(...) or text.encode() instead
         """
-        if not source_path.exists():
-            raise FileNotFoundError(f"Source template not found: {source_path}")
+        if isinstance(source, str):
+            raise TypeError(
+                "source must be a Path or bytes, not str; "
+                "use Path(source) for a file or source.encode() for content"
+            )
+        if isinstance(source, Path) and not source.exists():
+            raise FileNotFoundError(f"Source template not found: {source}")
         
         # Create user template directory
         target_dir = cls.USER_TEMPLATES / category
         target_dir.mkdir(parents=True, exist_ok=True)
         
-        # Copy template
+        # Copy template, or write the given content directly
         target_path = target_dir / filename
-        shutil.copy2(source_path, target_path)
+        if isinstance(source, Path):
+            shutil.copy2(source, target_path)
+        else:
+            target_path.write_bytes(source)
+        cls.invalidate()
         
         return target_path
     
@@ -112,6 +161,7 @@ class TemplateLoader:
         
         if override_path.exists():
             override_path.unlink()
+            cls.invalidate()
             return True
         
         return False
@@ -121,20 +171,43 @@ class TemplateLoader:
         """
         List all user template overrides.
         
+        The directory scan is cached per USER_TEMPLATES path and the
+        modification times of that directory and its category directories,
+        so templates added or removed by other means are also picked up. A
+        missing directory is never cached.
+        
         Returns:
             List of template paths that are overridden
         """
-        if not cls.USER_TEMPLATES.exists():
+        signature = _tree_signature(cls.USER_TEMPLATES)
+        if signature is None:
             return []
-        
+        return list(cls._scan_overrides(cls.USER_TEMPLATES, signature))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _scan_overrides(
+        user_templates: Path, signature: Tuple[Tuple[str, int], ...]
+    ) -> Tuple[str, ...]:
         overrides = []
-        for category_dir in cls.USER_TEMPLATES.iterdir():
+        for category_dir in user_templates.iterdir():
             if category_dir.is_dir():
                 for template_file in category_dir.glob("*.j2"):
-                    relative_path = template_file.relative_to(cls.USER_TEMPLATES)
+                    relative_path = template_file.relative_to(user_templates)
                     overrides.append(str(relative_path))
         
-        return sorted(overrides)
+        return tuple(sorted(overrides))
+    
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Drop the cached list_overrides() scan and Jinja2 environments.
+        
+        Call this after changing user templates without going through
+        override_template(), reset_template() or clear_all_overrides().
+        """
+        cls._scan_overrides.cache_clear()
+        cls._build_env.cache_clear()
     
     @classmethod
     def list_default_templates(cls) -> List[str]:
@@ -220,6 +293,7 @@ class TemplateLoader:
         for template_file in cls.USER_TEMPLATES.rglob("*.j2"):
             template_file.unlink()
             count += 1
+        cls.invalidate()
         
         return count
 
@@ -234,13 +308,13 @@ class TemplateManager:
     def __init__(self):
         self.loader = TemplateLoader()
     
-    def override(self, template_path: str, custom_template: Path) -> None:
+    def override(self, template_path: str, custom_template: Union[Path, bytes]) -> None:
         """
         Override a template with custom version.
         
         Args:
             template_path: Relative path like 'orchestration/airflow_dag.py.j2'
-            custom_template: Path to custom template file
+            custom_template: Path to custom template file, or its content
         """
         parts = Path(template_path).parts
         
@@ -6,10 +6,12 @@ Allows updating existing AntiGravity projects with new providers or configuratio
 while preserving user modifications.
 """
 
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+import os
 import yaml
 from difflib import unified_diff
 from rich.console import Console
@@ -19,6 +21,12 @@ from rich.panel import Panel
 
 console = Console()
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 
 @dataclass
 class FileChange:
@@ -89,13 +97,23 @@ class ProjectMetadata:
             "modified_files": []  # User-modified generated files
         }
     
+    @staticmethod
+    def dumps(metadata: Dict) -> str:
+        """Serialize metadata to .antigravity.yml content"""
+        return yaml.dump(metadata, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+    
+    @staticmethod
+    def loads(content: str) -> Dict:
+        """Parse .antigravity.yml content"""
+        return yaml.load(content, Loader=SafeLoader)
+    
     @staticmethod
     def write(project_path: Path, metadata: Dict) -> None:
         """Write metadata to .antigravity.yml"""
         metadata_path = project_path / ProjectMetadata.METADATA_FILE
         
         with open(metadata_path, 'w') as f:
-            yaml.dump(metadata, f, default_flow_style=False, sort_keys=False)
+            f.write(ProjectMetadata.dumps(metadata))
     
     @staticmethod
     def read(project_path: Path) -> Dict:
@@ -108,7 +126,7 @@ class ProjectMetadata:
             )
         
         with open(metadata_path) as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
     
     @staticmethod
     def update(project_path: Path, **updates) -> None:
@@ -146,27 +164,56 @@ class ProjectUpdater:
     - Applying changes selectively
     """
     
-    def __init__(self, project_path: Path):
+    def __init__(self, project_path: Optional[Path], metadata: Optional[Dict] = None):
         """
         Initialize updater for a project.
         
         Args:
-            project_path: Path to the project directory
+            project_path: Path to the project directory; may be None only
+                when metadata is given
+            metadata: Already-parsed project metadata; read from
+                project_path when omitted
         """
-        self.project_path = Path(project_path)
+        self.project_path = Path(project_path) if project_path is not None else None
         
-        if not self.project_path.exists():
-            raise FileNotFoundError(f"Project not found: {project_path}")
+        if metadata is None:
+            if self.project_path is None:
+                raise ValueError("project_path is required when metadata is not given")
+            if not self.project_path.exists():
+                raise FileNotFoundError(f"Project not found: {project_path}")
+            
+            # Load project metadata
+            try:
+                metadata = ProjectMetadata.read(self.project_path)
+            except FileNotFoundError:
+                raise ValueError(
+                    f"Not an AntiGravity project. Missing {ProjectMetadata.METADATA_FILE}"
+                )
+        
+        self.metadata = metadata
+        self.current_stack = self.metadata["project"]["stack"]
+    
+    @classmethod
+    def from_vfs(cls, vfs, project_path: Optional[Path] = None) -> "ProjectUpdater":
+        """
+        Create an updater from a generated VirtualFileSystem, without disk I/O.
         
-        # Load project metadata
-        try:
-            self.metadata = ProjectMetadata.read(self.project_path)
-        except FileNotFoundError:
+        Enough for analyze_changes(); update() still needs project_path.
+        
+        Args:
+            vfs: VirtualFileSystem holding the project's .antigravity.yml
+            project_path: Optional directory the project lives in
+        
+        Returns:
+            ProjectUpdater for the in-memory project
+        """
+        content = vfs.get_file(ProjectMetadata.METADATA_FILE)
+        if content is None:
             raise ValueError(
                 f"Not an AntiGravity project. Missing {ProjectMetadata.METADATA_FILE}"
             )
         
-        self.current_stack = self.metadata["project"]["stack"]
+        return cls(project_path, metadata=ProjectMetadata.loads(content))
     
     def analyze_changes(self, new_stack: Dict[str, str]) -> UpdatePlan:
         """
@@ -212,7 +259,13 @@ class ProjectUpdater:
         
         Returns:
             UpdatePlan that was executed
+        
+        Raises:
+            ValueError: If the updater has no project_path (see from_vfs)
         """
+        if self.project_path is None:
+            raise ValueError("Cannot update a project without a project_path")
+        
         # Determine target stack
         target_stack = self.current_stack.copy()
         
@@ -296,16 +349,39 @@ class ProjectUpdater:
         )
         
         # Add new files
-        for file_path in vfs.list_files():
+        files = vfs.list_files()
+        existing = self._existing_paths(files)
+        for file_path in files:
             full_path = self.project_path / file_path
             
-            if not full_path.exists():
+            if file_path not in existing:
                 # New file - add it
                 full_path.parent.mkdir(parents=True, exist_ok=True)
                 with open(full_path, 'w') as f:
                     f.write(vfs.get_file(file_path))
                 console.print(f"  [green]✓[/green] Added: {file_path}")
     
+    def _existing_paths(self, paths: List[str]) -> set:
+        """
+        Return the relative paths that already exist in the project.
+        
+        Lists each parent directory once with os.scandir instead of
+        stat-ing every path.
+        """
+        by_dir: Dict[str, List[str]] = defaultdict(list)
+        for path in paths:
+            by_dir[os.path.dirname(path)].append(path)
+        
+        existing = set()
+        for directory, members in by_dir.items():
+            try:
+                with os.scandir(self.project_path / directory) as entries:
+                    names = {entry.name for entry in entries}
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            existing.update(p for p in members if os.path.basename(p) in names)
+        return existing
+    
     def show_diff(self, file_path: str) -> None:
         """Show diff for a specific file"""
         # This would compare current file with what would be generated
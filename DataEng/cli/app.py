@@ -1,16 +1,26 @@
 import sys
 import os
 import asyncio
+import importlib.util
+from pathlib import Path
 from typing import Dict
 
-# Add backend to sys.path to allow imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-backend_path = os.path.join(current_dir, '..', 'backend')
-sys.path.append(backend_path)
+# Resolved once at import; load_providers() runs on every mount
+_BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+_PROVIDERS_DIR = _BACKEND_DIR / "core" / "providers"
+
+# backend/ is importable after `pip install -e .`; fall back to a path
+# entry when running from a plain checkout, or when the `core` found is
+# some other package
+_core_spec = importlib.util.find_spec("core")
+if _core_spec is None or Path(_core_spec.origin or "").resolve().parent != _BACKEND_DIR / "core":
+    sys.path.insert(0, str(_BACKEND_DIR))
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, VerticalScroll
-from textual.widgets import Header, Footer, Button, Label, RadioSet, RadioButton, Static, Input
+from textual.widgets import (
+    Header, Footer, Button, Label, RadioSet, RadioButton, Static, Input, LoadingIndicator
+)
 from textual.binding import Binding
 
 from core.registry import ProviderRegistry
@@ -33,7 +43,6 @@ from core.engine import TemplateEngine
 # Re-reading `engine.py` refactor: it uses `ProviderRegistry.get_provider`.
 # IF no providers are registered, the UI will be empty.
 # I will check `backend/core/providers`.
-)
 
 # Mock registration for the purpose of the CLI working if no providers file exists yet
 # The user asked to "Refactor ... backend/core/engine.py" and "interfaces.py".
@@ -52,17 +61,17 @@ from core.engine import TemplateEngine
 
 def load_providers():
     # Attempt to load providers from backend/core/providers
-    providers_dir = os.path.join(backend_path, 'core', 'providers')
-    if os.path.exists(providers_dir):
-        for filename in os.listdir(providers_dir):
-            if filename.endswith(".py") and filename != "__init__.py":
-                module_name = filename[:-3]
-                try:
-                    # Dynamic import
-                    full_module_name = f"core.providers.{module_name}"
-                    __import__(full_module_name)
-                except Exception as e:
-                    pass
+    if _PROVIDERS_DIR.exists():
+        # scandir yields DirEntry names lazily, so filter while walking
+        with os.scandir(_PROVIDERS_DIR) as it:
+            for entry in it:
+                filename = entry.name
+                if filename.endswith(".py") and filename != "__init__.py":
+                    try:
+                        # Dynamic import
+                        __import__(f"core.providers.{filename[:-3]}")
+                    except Exception as e:
+                        pass
 
 class AntiGravityApp(App):
     CSS = """
@@ -96,54 +105,68 @@ class AntiGravityApp(App):
         width: 100%;
         margin-top: 1;
     }
+    #providers_loading {
+        height: 3;
+    }
     """
 
     TITLE = "AntiGravity Generator"
     BINDINGS = [("q", "quit", "Quit")]
 
     def on_mount(self) -> None:
-        load_providers()
+        # Importing every provider module is slow; do it off the UI thread so
+        # the first frame paints immediately, then fill in the radio sets.
+        self.run_worker(self._load_providers_bg, thread=True)
         
     def compose(self) -> ComposeResult:
         yield Header()
         
-        with VerticalScroll():
+        with VerticalScroll(id="form"):
             yield Label("Project Configuration")
             yield Input(placeholder="Project Name", id="project_name", value="my-data-platform")
             
-            # Dynamically generate sections based on Registry
-            # We need to call load_providers() first or inside here.
-            # compose() is synchronous. We'll try to load providers at module level or here.
-            load_providers()
-            providers = ProviderRegistry.get_all_providers()
-            
-            # If registry is empty, fallback to the hardcoded list from StackSelector for demo purposes
-            # (In a real scenario, we'd ensure registration works)
-            if not any(providers.values()):
-                # Fallback / Mock
-                categories = ["ingestion", "storage", "transformation", "orchestration"]
-                # We can't easily register them here without classes, so we rely on what's there.
-                # If empty, we show a message.
-                pass
-
-            if not any(providers.values()):
-                 yield Label("No providers registered in backend/core/providers!")
-            
-            for category, tools in providers.items():
-                if not tools:
-                    continue
-                yield Label(category.capitalize())
-                with Container(classes="box"):
-                    with RadioSet(id=f"radio_{category}"):
-                        yield RadioButton("None", value="None", value_type="string", id=f"{category}_none")
-                        for tool in tools:
-                             yield RadioButton(tool, value=tool, id=f"{category}_{tool}")
+            # Provider sections are mounted by _refresh_radio_sets() once
+            # the background worker has registered them.
+            yield LoadingIndicator(id="providers_loading")
 
             yield Button("Generate Project", id="btn_generate", variant="primary")
             yield Static(id="status", content="")
 
         yield Footer()
 
+    def _load_providers_bg(self) -> None:
+        load_providers()
+        self.call_from_thread(self._refresh_radio_sets)
+
+    def _refresh_radio_sets(self) -> None:
+        self.query_one("#providers_loading").remove()
+        self.query_one("#form", VerticalScroll).mount(
+            *self._provider_widgets(), before="#btn_generate"
+        )
+
+    def _provider_widgets(self):
+        # Dynamically generate sections based on Registry
+        providers = ProviderRegistry.get_all_providers()
+
+        # If registry is empty, show a message instead of the radio sets
+        providers_empty = not any(providers.values())
+        if providers_empty:
+            yield Label("No providers registered in backend/core/providers!")
+            return
+        
+        for category, tools in providers.items():
+            if not tools:
+                continue
+            yield Label(category.capitalize())
+            yield Container(
+                RadioSet(
+                    RadioButton("None", value=True, id=f"{category}_none"),
+                    *(RadioButton(tool, id=f"{category}_{tool}") for tool in tools),
+                    id=f"radio_{category}",
+                ),
+                classes="box",
+            )
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "btn_generate":
             self.generate_project()
@@ -158,17 +181,20 @@ class AntiGravityApp(App):
         stack = {}
         providers = ProviderRegistry.get_all_providers()
         for category in providers.keys():
-            try:
-                radio_set = self.query_one(f"#radio_{category}", RadioSet)
-                if radio_set.pressed_button:
-                    selected = radio_set.pressed_button.label.plain
-                    if selected != "None":
-                        stack[category] = selected
-                    else:
-                         stack[category] = None
+            # Categories without tools (or not mounted yet) have no RadioSet;
+            # an empty query is cheaper and narrower than catching NoMatches.
+            radio_sets = self.query(f"#radio_{category}")
+            if not radio_sets:
+                stack[category] = None
+                continue
+            radio_set = radio_sets.first(RadioSet)
+            if radio_set.pressed_button:
+                selected = radio_set.pressed_button.label.plain
+                if selected != "None":
+                    stack[category] = selected
                 else:
-                    stack[category] = None
-            except:
+                     stack[category] = None
+            else:
                 stack[category] = None
 
         self.query_one("#status", Static).update(f"Generating {project_name} with stack: {stack}...")
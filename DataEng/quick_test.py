@@ -1,93 +1,169 @@
 """Test rápido de validación del sistema"""
+import contextlib
+import io
 import sys
+import time
 sys.path.insert(0, "backend")
 
-print("="*80)
-print("TESTS DE VALIDACIÓN - AntiGravity")
-print("="*80)
+BENCH_ITERATIONS = 1000
+
+MODERN_STACK = {
+    "ingestion": "DLT",
+    "storage": "PostgreSQL",
+    "transformation": "dbt",
+    "orchestration": "Airflow"
+}
+KAFKA_DBT_STACK = {"ingestion": "Kafka", "transformation": "dbt"}
+MONGODB_DBT_STACK = {"storage": "MongoDB", "transformation": "dbt"}
+MONGODB_SPARK_STACK = {"storage": "MongoDB", "transformation": "Spark"}
+
+
+def bench_validate(stack):
+    """Micro-benchmark de validate_stack: devuelve microsegundos por llamada."""
+    from core.stack_validator import StackValidator
+    StackValidator.validate_stack(stack)  # warm-up
+    t0 = time.perf_counter()
+    for _ in range(BENCH_ITERATIONS):
+        StackValidator.validate_stack(stack)
+    return (time.perf_counter() - t0) / BENCH_ITERATIONS * 1e6
+
 
 # Test 1: Imports
-try:
+def test_imports():
     from core.registry import ProviderRegistry
     from core.stack_validator import StackValidator
     print("✅ Test 1: Imports exitosos")
-except Exception as e:
-    print(f"❌ Test 1: Error en imports - {e}")
-    exit(1)
+
 
 # Test 2: Providers Registry
-try:
+def test_registry():
+    from core.registry import ProviderRegistry
     providers = ProviderRegistry.get_all_providers()
     assert len(providers) == 8, f"Expected 8 categories, got {len(providers)}"
     print(f"✅ Test 2: ProviderRegistry OK - {len(providers)} categorías")
     for cat, tools in providers.items():
         print(f"   - {cat}: {len(tools)} providers")
-except Exception as e:
-    print(f"❌ Test 2: {e}")
+
 
 # Test 3: Stack válido
-try:
-    stack = {
-        "ingestion": "DLT",
-        "storage": "PostgreSQL",
-        "transformation": "dbt",
-        "orchestration": "Airflow"
-    }
-    is_valid, errors, warnings = StackValidator.validate_stack(stack)
+def test_valid_stack():
+    from core.stack_validator import StackValidator
+    is_valid, errors, warnings = StackValidator.validate_stack(MODERN_STACK)
     assert is_valid, f"Stack should be valid but got errors: {errors}"
     print("✅ Test 3: Stack Modern Data válido")
-except Exception as e:
-    print(f"❌ Test 3: {e}")
+
 
 # Test 4: Incompatibilidad Kafka+dbt
-try:
-    stack = {"ingestion": "Kafka", "transformation": "dbt"}
-    is_valid, errors, warnings = StackValidator.validate_stack(stack)
+def test_kafka_dbt():
+    from core.stack_validator import StackValidator
+    is_valid, errors, warnings = StackValidator.validate_stack(KAFKA_DBT_STACK)
     assert not is_valid, "Kafka+dbt should be invalid"
-    print("✅ Test 4: Kafka+dbt detectado como inv\u00e1lido")
-except Exception as e:
-    print(f"❌ Test 4: {e}")
+    print("✅ Test 4: Kafka+dbt detectado como inválido")
+
 
 # Test 5: Incompatibilidad MongoDB+dbt
-try:
-    stack = {"storage": "MongoDB", "transformation": "dbt"}
-    is_valid, errors, warnings = StackValidator.validate_stack(stack)
+def test_mongodb_dbt():
+    from core.stack_validator import StackValidator
+    is_valid, errors, warnings = StackValidator.validate_stack(MONGODB_DBT_STACK)
     assert not is_valid, "MongoDB+dbt should be invalid"
     print("✅ Test 5: MongoDB+dbt detectado como inválido")
-except Exception as e:
-    print(f"❌ Test 5: {e}")
+
 
 # Test 6: Stack NoSQL válido
-try:
-    stack = {"storage": "MongoDB", "transformation": "Spark"}
-    is_valid, errors, warnings = StackValidator.validate_stack(stack)
+def test_mongodb_spark():
+    from core.stack_validator import StackValidator
+    is_valid, errors, warnings = StackValidator.validate_stack(MONGODB_SPARK_STACK)
     assert is_valid, f"MongoDB+Spark should be valid, errors: {errors}"
     print("✅ Test 6: MongoDB+Spark válido")
-except Exception as e:
-    print(f"❌ Test 6: {e}")
+
 
 #  Test 7: VirtualFileSystem
-try:
+def test_vfs():
     from core.engine import VirtualFileSystem
     vfs = VirtualFileSystem()
     vfs.add_file("test.txt", "content")
     assert "test.txt" in vfs.list_files()
     assert vfs.get_file("test.txt") == "content"
     print("✅ Test 7: VirtualFileSystem funciona")
-except Exception as e:
-    print(f"❌ Test 7: {e}")
+
 
 # Test 8: ProjectContext
-try:
+def test_project_context():
     from core.manifest import ProjectContext
     ctx = ProjectContext(project_name="test", stack={})
     secret = ctx.get_or_create_secret("test_secret")
     assert len(secret) > 0
     assert ctx.get_or_create_secret("test_secret") == secret
     print("✅ Test 8: ProjectContext y secretos OK")
-except Exception as e:
-    print(f"❌ Test 8: {e}")
 
-print("\n" + "="*80)
-print("🎉 TESTS BÁSICOS COMPLETADOS EXITOSAMENTE")
-print("="*80)
+
+TESTS = [
+    ("imports", test_imports),
+    ("registry", test_registry),
+    ("valid_stack", test_valid_stack),
+    ("kafka_dbt", test_kafka_dbt),
+    ("mongodb_dbt", test_mongodb_dbt),
+    ("mongodb_spark", test_mongodb_spark),
+    ("vfs", test_vfs),
+    ("project_context", test_project_context),
+]
+
+# Se miden aparte, para que los tiempos de cada test no incluyan el benchmark
+BENCHMARKS = [
+    ("valid_stack", MODERN_STACK),
+    ("kafka_dbt", KAFKA_DBT_STACK),
+    ("mongodb_dbt", MONGODB_DBT_STACK),
+    ("mongodb_spark", MONGODB_SPARK_STACK),
+]
+
+
+def main():
+    print("="*80)
+    print("TESTS DE VALIDACIÓN - AntiGravity")
+    print("="*80)
+
+    # Ejecuta todos los tests aunque alguno falle y resume al final.
+    # La salida se acumula en memoria y se escribe de una vez, para que
+    # la consola no penalice los tiempos medidos
+    results = []
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        for name, fn in TESTS:
+            t0 = time.perf_counter()
+            try:
+                fn()
+                ok, err = True, ""
+            except Exception as e:
+                ok, err = False, str(e)
+                print(f"❌ {name}: {err}")
+            results.append((name, ok, (time.perf_counter() - t0) * 1000, err))
+    sys.stdout.write(output.getvalue())
+
+    print("\n" + "="*80)
+    print(f"{'Test':<20} {'Estado':<8} {'ms':>10}  Error")
+    print("-"*80)
+    # Los más lentos primero
+    for name, ok, elapsed_ms, err in sorted(results, key=lambda r: r[2], reverse=True):
+        print(f"{name:<20} {'✅' if ok else '❌':<8} {elapsed_ms:>10.2f}  {err}")
+
+    print("\n" + "="*80)
+    print(f"{'Benchmark':<20} {'µs/llamada validate_stack':>30}")
+    print("-"*80)
+    for name, stack in BENCHMARKS:
+        try:
+            print(f"{name:<20} {bench_validate(stack):>30.1f}")
+        except Exception as e:
+            print(f"{name:<20} {'❌':>30}  {e}")
+
+    failed = sum(1 for _, ok, _, _ in results if not ok)
+    print("="*80)
+    if failed:
+        print(f"❌ {failed}/{len(results)} TESTS FALLIDOS")
+        print("="*80)
+        sys.exit(1)
+    print("🎉 TESTS BÁSICOS COMPLETADOS EXITOSAMENTE")
+    print("="*80)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,24 +3,33 @@ import sys
 import subprocess
 import shutil
 
-def run_command(command, cwd=None):
-    """Run a shell command and print output."""
+def run_command(argv, cwd=None):
+    """Run a command (given as an argv list) and return its output."""
     try:
         result = subprocess.run(
-            command,
+            argv,
             cwd=cwd,
             check=True,
             text=True,
-            shell=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE
         )
         return result.stdout.strip()
     except subprocess.CalledProcessError as e:
-        print(f"Error running command: {command}")
+        print(f"Error running command: {' '.join(argv)}")
         print(e.stderr)
         return None
 
+def _git_config_dict():
+    """Read all git config entries with a single `git config --list` call."""
+    output = run_command(["git", "config", "--list"]) or ""
+    config = {}
+    for line in output.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            config[key] = value
+    return config
+
 def check_git_installed():
     """Check if git is installed."""
     if not shutil.which("git"):
@@ -28,10 +37,10 @@ def check_git_installed():
         sys.exit(1)
     print("✅ Git is installed.")
 
-def check_gitignore():
+def check_gitignore(entries):
     """Check if .gitignore exists, create if not."""
     gitignore_path = ".gitignore"
-    if not os.path.exists(gitignore_path):
+    if gitignore_path not in entries:
         print("⚠️ .gitignore not found. Creating default .gitignore...")
         default_content = """
 .venv/
@@ -50,37 +59,37 @@ build/
     else:
         print("✅ .gitignore exists.")
 
-def init_repo():
+def init_repo(entries):
     """Initialize git repo if not already initialized."""
-    if not os.path.exists(".git"):
+    if ".git" not in entries:
         print("Initializing git repository...")
-        run_command("git init")
+        run_command(["git", "init"])
         print("✅ Git repository initialized.")
     else:
         print("✅ Git repository already initialized.")
 
-def configure_user():
+def configure_user(config):
     """Ensure git user name and email are set."""
-    user_name = run_command("git config user.name")
-    user_email = run_command("git config user.email")
+    user_name = config.get("user.name")
+    user_email = config.get("user.email")
     
     if not user_name:
         name = input("Enter your Name for git config: ").strip()
-        run_command(f'git config user.name "{name}"')
+        run_command(["git", "config", "user.name", name])
     
     if not user_email:
         email = input("Enter your Email for git config: ").strip()
-        run_command(f'git config user.email "{email}"')
+        run_command(["git", "config", "user.email", email])
 
 def add_files():
     """Stage all files."""
     print("Staging files...")
-    run_command("git add .")
+    run_command(["git", "add", "."])
     print("✅ Files staged.")
 
 def commit_changes():
     """Commit changes."""
-    status = run_command("git status --porcelain")
+    status = run_command(["git", "status", "--porcelain"])
     if not status:
         print("Nothing to commit.")
         return False
@@ -89,18 +98,17 @@ def commit_changes():
     if not message:
         message = "Initial commit"
     
-    run_command(f'git commit -m "{message}"')
+    run_command(["git", "commit", "-m", message])
     print(f"✅ Changes committed with message: '{message}'")
     return True
 
-def setup_remote():
+def setup_remote(config):
     """Setup remote origin."""
-    remotes = run_command("git remote -v")
-    if "origin" not in str(remotes):
+    if "remote.origin.url" not in config:
         print("\n⚠️ No remote 'origin' configured.")
         url = input("Enter the GitHub Repository URL (e.g., https://github.com/user/repo.git): ").strip()
         if url:
-            run_command(f"git remote add origin {url}")
+            run_command(["git", "remote", "add", "origin", url])
             print(f"✅ Remote 'origin' added: {url}")
         else:
             print("❌ No URL provided. Cannot push.")
@@ -113,10 +121,10 @@ def push_changes():
     """Push changes to remote."""
     print("Pushing to GitHub...")
     # Check current branch name
-    branch = run_command("git branch --show-current") or "main"
+    branch = run_command(["git", "branch", "--show-current"]) or "main"
     
     # Push
-    result = run_command(f"git push -u origin {branch}")
+    result = run_command(["git", "push", "-u", "origin", branch])
     if result is not None:
         print("✅ Successfully pushed to GitHub!")
     else:
@@ -128,13 +136,17 @@ def main():
     print(f"Working directory: {project_root}")
     
     check_git_installed()
-    check_gitignore()
-    init_repo()
-    configure_user()
+    # One directory read covers both the .gitignore and .git checks
+    with os.scandir(".") as it:
+        entries = {entry.name for entry in it}
+    check_gitignore(entries)
+    init_repo(entries)
+    git_config = _git_config_dict()
+    configure_user(git_config)
     add_files()
-    if commit_changes() or run_command("git status --porcelain") == "":
+    if commit_changes() or run_command(["git", "status", "--porcelain"]) == "":
         # Proceed if committed or clean, but we might want to push existing commits
-        if setup_remote():
+        if setup_remote(git_config):
             push_changes()
     
     print("\n🎉 Done!")
@@ -46,7 +46,7 @@ pip install -r backend/requirements.txt
 
 echo ""
 echo "Installing development dependencies..."
-pip install pytest pytest-cov pytest-asyncio httpx black isort flake8 mypy
+pip install pytest pytest-cov pytest-asyncio pytest-xdist httpx black isort flake8 mypy
 
 # Verify installation
 echo ""
@@ -11,12 +11,19 @@ Usage:
     python source_cli.py remove [name] - Remove a source
 """
 
+import argparse
+import importlib.util
 import sys
 import os
 from pathlib import Path
 
-# Add backend to path
-sys.path.insert(0, str(Path(__file__).parent / "backend"))
+# backend/ is importable after `pip install -e .`; fall back to a path
+# entry when running from a plain checkout, or when the `core` found is
+# some other package
+_BACKEND_DIR = Path(__file__).resolve().parent / "backend"
+_core_spec = importlib.util.find_spec("core")
+if _core_spec is None or Path(_core_spec.origin or "").resolve().parent != _BACKEND_DIR / "core":
+    sys.path.insert(0, str(_BACKEND_DIR))
 
 from rich.console import Console
 from rich.prompt import Prompt, Confirm, IntPrompt
@@ -29,6 +36,11 @@ from core.manifest import DataSource
 console = Console()
 
 
+def _truncate(text: str, width: int) -> str:
+    """Shorten text to width characters, ending with '...' when cut"""
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
 def source_add_interactive():
     """Interactive wizard to add a new data source"""
     console.print("\n[bold cyan]➕ Add New Data Source[/bold cyan]\n")
@@ -166,22 +178,16 @@ def source_list():
         table.add_column("Schedule", style="yellow", width=15)
         table.add_column("Status", style="white", width=12)
         
-        for idx, source in enumerate(sources, 1):
-            status = "✅ Enabled" if source.enabled else "⏸️  Disabled"
-            base_url = source.config.get("base_url", "N/A")
-            # Truncate long URLs
-            if len(base_url) > 28:
-                base_url = base_url[:25] + "..."
-            
-            table.add_row(
-                str(idx),
-                source.name,
-                source.type,
-                source.connector,
-                base_url,
-                source.schedule or "[dim]Manual[/dim]",
-                status
-            )
+        # Prepare each column up front, then hand complete rows to Rich
+        names = [source.name for source in sources]
+        types = [source.type for source in sources]
+        connectors = [source.connector for source in sources]
+        base_urls = [_truncate(source.config.get("base_url", "N/A"), 28) for source in sources]
+        schedules = [source.schedule or "[dim]Manual[/dim]" for source in sources]
+        statuses = ["✅ Enabled" if source.enabled else "⏸️  Disabled" for source in sources]
+        
+        for idx, row in enumerate(zip(names, types, connectors, base_urls, schedules, statuses), 1):
+            table.add_row(str(idx), *row)
         
         console.print(table)
         console.print(f"\n[green]Total: {len(sources)} source(s)[/green]\n")
@@ -299,35 +305,62 @@ def show_help():
 """)
 
 
+COMMANDS = ("add", "list", "test", "remove", "help")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Top-level parser: only selects the command, the rest is left unparsed"""
+    parser = argparse.ArgumentParser(prog="source_cli.py", add_help=False)
+    parser.add_argument("-h", "--help", action="store_true")
+    parser.add_argument("command", nargs="?", type=str.lower, choices=COMMANDS)
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    return parser
+
+
+# Per-command parsers are built only for the command actually invoked
+
+def build_add_parser() -> argparse.ArgumentParser:
+    return argparse.ArgumentParser(prog="source_cli.py add")
+
+
+def build_list_parser() -> argparse.ArgumentParser:
+    return argparse.ArgumentParser(prog="source_cli.py list")
+
+
+def build_test_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="source_cli.py test")
+    parser.add_argument("name", nargs="?", help="Source to test (prompted if omitted)")
+    return parser
+
+
+def build_remove_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="source_cli.py remove")
+    parser.add_argument("name", nargs="?", help="Source to remove (prompted if omitted)")
+    return parser
+
+
 def main():
     """Main entry point"""
     try:
-        if len(sys.argv) < 2:
-            show_help()
-            return
+        args = build_parser().parse_args()
+        command = args.command
         
-        command = sys.argv[1].lower()
+        if args.help or command in (None, "help"):
+            show_help()
         
-        if command == "add":
+        elif command == "add":
+            build_add_parser().parse_args(args.args)
             source_add_interactive()
         
         elif command == "list":
+            build_list_parser().parse_args(args.args)
             source_list()
         
         elif command == "test":
-            source_name = sys.argv[2] if len(sys.argv) > 2 else None
-            source_test(source_name)
+            source_test(build_test_parser().parse_args(args.args).name)
         
         elif command == "remove":
-            source_name = sys.argv[2] if len(sys.argv) > 2 else None
-            source_remove(source_name)
-        
-        elif command in ["help", "-h", "--help"]:
-            show_help()
-        
-        else:
-            console.print(f"[red]Unknown command: {command}[/red]")
-            show_help()
+            source_remove(build_remove_parser().parse_args(args.args).name)
     
     except KeyboardInterrupt:
         console.print("\n[yellow]Cancelled by user[/yellow]")
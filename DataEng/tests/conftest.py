@@ -4,20 +4,127 @@ Pytest configuration and shared fixtures for AntiGravity tests.
 This module contains common fixtures used across all test modules.
 """
 
-import pytest
-import tempfile
+import functools
+import importlib.util
+import itertools
+import os
 import shutil
+import sys
+import tempfile
+
+import pytest
 from pathlib import Path
-from jinja2 import Environment, DictLoader
+from jinja2 import Environment, DictLoader, FileSystemBytecodeCache, FileSystemLoader
 from typing import Dict, Any
 
-# Add backend to path
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+# backend/ is importable after `pip install -e .`; fall back to a path
+# entry when running from a plain checkout, or when the `core` found is
+# some other package
+_BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+_core_spec = importlib.util.find_spec("core")
+if _core_spec is None or Path(_core_spec.origin or "").resolve().parent != _BACKEND_DIR / "core":
+    sys.path.insert(0, str(_BACKEND_DIR))
 
 from core.manifest import ProjectContext
 from core.engine import VirtualFileSystem
 
+TEMPLATE_DIR = _BACKEND_DIR / "templates"
+
+
+@pytest.fixture(scope="session")
+def providers_loaded():
+    """
+    Imports every provider module once so ProviderRegistry is populated.
+    
+    Registration happens as an import side effect of the provider modules.
+    """
+    from core.providers import load_all
+    load_all()
+
+
+_project_ids = itertools.count()
+
+
+@pytest.fixture
+def project_id():
+    """
+    Provides a distinct project id for each test.
+    
+    Ids come from a counter rather than uuid4(): tests only need them
+    unique within the run, not random.
+    
+    Returns:
+        UUID-shaped id string
+    """
+    return f"{next(_project_ids):08x}-0000-4000-8000-000000000000"
+
+
+@pytest.fixture(scope="session")
+def template_engine(providers_loaded):
+    """
+    Provides one TemplateEngine shared by the whole session.
+    
+    Building the Jinja2 Environment and its loader cache is done once
+    instead of per test. Under pytest-xdist every worker is its own
+    process, so each worker builds its own engine and nothing is shared
+    across workers.
+    
+    Returns:
+        TemplateEngine with every provider registered
+    """
+    from core.engine import TemplateEngine
+    return TemplateEngine()
+
+
+@pytest.fixture(scope="session")
+def template_dir():
+    """
+    Provides the backend/templates directory.
+    
+    Returns:
+        Path to the real templates
+    """
+    return TEMPLATE_DIR
+
+
+@pytest.fixture(scope="session")
+def jinja_env(pytestconfig):
+    """
+    Provides one Jinja2 Environment over backend/templates for the session.
+    
+    auto_reload is off and the template cache is unbounded, so repeated
+    get_template calls are plain cache hits. When pytest's cache is
+    enabled, compiled bytecode is also kept under .pytest_cache and reused
+    by later runs; Jinja keys it by source checksum, so edits are picked up.
+    
+    Returns:
+        Environment loading the real templates
+    """
+    cache = getattr(pytestconfig, "cache", None)
+    bytecode_cache = None
+    if cache is not None:
+        bytecode_cache = FileSystemBytecodeCache(str(cache.mkdir("jinja_bytecode")))
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=bytecode_cache,
+    )
+
+
+@pytest.fixture(scope="session")
+def get_template(jinja_env):
+    """
+    Provides a memoized jinja_env.get_template for the session.
+    
+    Each template is looked up and compiled once; later calls return the
+    same Template object.
+    
+    Returns:
+        Callable taking a template path and returning its Template
+    """
+    return functools.cache(jinja_env.get_template)
+
 
 @pytest.fixture
 def mock_jinja_env():
@@ -34,6 +141,16 @@ def mock_jinja_env():
     return Environment(loader=DictLoader(templates))
 
 
+def _sample_stack() -> Dict[str, str]:
+    return {
+        "ingestion": "DLT",
+        "storage": "PostgreSQL",
+        "transformation": "dbt",
+        "orchestration": "Airflow",
+        "infrastructure": "terraform"
+    }
+
+
 @pytest.fixture
 def sample_stack() -> Dict[str, str]:
     """
@@ -42,13 +159,7 @@ def sample_stack() -> Dict[str, str]:
     Returns:
         Dictionary with all categories populated
     """
-    return {
-        "ingestion": "DLT",
-        "storage": "PostgreSQL",
-        "transformation": "dbt",
-        "orchestration": "Airflow",
-        "infrastructure": "terraform"
-    }
+    return _sample_stack()
 
 
 @pytest.fixture
@@ -65,10 +176,27 @@ def minimal_stack() -> Dict[str, str]:
     }
 
 
+@pytest.fixture(scope="module")
+def shared_project_context() -> ProjectContext:
+    """
+    Provides one ProjectContext shared by every test in a module.
+    
+    Only for read-only or additive use (secrets, ports); tests that
+    register connections should use fresh_project_context.
+    
+    Returns:
+        ProjectContext instance with sample configuration
+    """
+    return ProjectContext(
+        project_name="test_project",
+        stack=_sample_stack()
+    )
+
+
 @pytest.fixture
-def sample_project_context(sample_stack) -> ProjectContext:
+def fresh_project_context(sample_stack) -> ProjectContext:
     """
-    Provides a pre-configured ProjectContext for testing.
+    Provides a new ProjectContext for tests that mutate it.
     
     Args:
         sample_stack: Sample stack configuration fixture
@@ -102,25 +230,65 @@ def populated_vfs() -> VirtualFileSystem:
         VirtualFileSystem with test files
     """
     vfs = VirtualFileSystem()
-    vfs.add_file("README.md", "# Test Project")
-    vfs.add_file("docker-compose.yml", "version: '3.8'")
-    vfs.add_file("dags/test_dag.py", "# Airflow DAG")
+    vfs.add_files({
+        "README.md": "# Test Project",
+        "docker-compose.yml": "version: '3.8'",
+        "dags/test_dag.py": "# Airflow DAG",
+    })
     return vfs
 
 
-@pytest.fixture
-def temp_output_dir():
+@pytest.fixture(scope="session")
+def fast_tmp_root(tmp_path_factory):
     """
-    Provides a temporary directory for file generation tests.
+    Provides one scratch root for the whole session, on tmpfs when possible.
     
-    Automatically cleaned up after test completion.
+    /dev/shm is used when it is writable, so directory churn never hits
+    the disk; otherwise pytest's own base temp dir. Tests carve their own
+    subdirectories (see fast_tmp_dir) and the tree is removed once at
+    session end instead of per test. Under pytest-xdist each worker gets
+    its own root, tagged with the worker id.
     
     Yields:
-        Path to temporary directory
+        Path to the session scratch root
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        root = Path(tempfile.mkdtemp(prefix=f"antigravity_{worker}_", dir=shm))
+        yield root
+        shutil.rmtree(root, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp(f"antigravity_{worker}")
+
+
+_tmp_dirs = itertools.count()
+
+
+@pytest.fixture
+def fast_tmp_dir(fast_tmp_root):
+    """
+    Provides a fresh, empty directory under fast_tmp_root.
+    
+    Not removed per test; the session root is cleaned up in one pass.
+    
+    Returns:
+        Path to the new directory
+    """
+    path = fast_tmp_root / f"t_{next(_tmp_dirs)}"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def temp_output_dir(fast_tmp_dir):
+    """
+    Provides a temporary directory for file generation tests.
+    
+    Returns:
+        Path to temporary directory, as a string
     """
-    temp_dir = tempfile.mkdtemp(prefix="antigravity_test_")
-    yield temp_dir
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    return str(fast_tmp_dir)
 
 
 @pytest.fixture
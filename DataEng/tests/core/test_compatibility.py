@@ -2,13 +2,32 @@
 Tests for Compatibility Matrix and Stack Validator
 """
 import pytest
-from backend.core.compatibility_matrix import (
+from core.compatibility_matrix import (
     COMPATIBILITY_MATRIX,
     is_compatible,
     get_compatible_providers,
     get_provider_info
 )
-from backend.core.stack_validator import StackValidator
+from core.stack_validator import StackValidator
+
+
+@pytest.fixture(scope="session")
+def validator():
+    """
+    Memoized StackValidator.validate_stack shared by the whole session.
+    
+    Returns:
+        Callable taking a stack and returning (is_valid, errors, warnings)
+    """
+    cache = {}
+    
+    def run(stack):
+        key = tuple(sorted(stack.items()))
+        if key not in cache:
+            cache[key] = StackValidator.validate_stack(stack)
+        return cache[key]
+    
+    return run
 
 
 class TestCompatibilityMatrix:
@@ -23,22 +42,20 @@ class TestCompatibilityMatrix:
         assert "quality" in COMPATIBILITY_MATRIX
         assert "monitoring" in COMPATIBILITY_MATRIX
     
-    def test_all_providers_defined(self):
+    @pytest.mark.parametrize("category,provider", [
+        ("ingestion", "DLT"),
+        ("ingestion", "Airbyte"),
+        ("ingestion", "Kafka"),
+        ("storage", "PostgreSQL"),
+        ("storage", "Snowflake"),
+        ("storage", "BigQuery"),
+        ("storage", "MongoDB"),
+        ("transformation", "dbt"),
+        ("transformation", "Spark"),
+    ])
+    def test_all_providers_defined(self, category, provider):
         """Test that all known providers are in the matrix."""
-        # Ingestion
-        assert "DLT" in COMPATIBILITY_MATRIX["ingestion"]
-        assert "Airbyte" in COMPATIBILITY_MATRIX["ingestion"]
-        assert "Kafka" in COMPATIBILITY_MATRIX["ingestion"]
-        
-        # Storage
-        assert "PostgreSQL" in COMPATIBILITY_MATRIX["storage"]
-        assert "Snowflake" in COMPATIBILITY_MATRIX["storage"]
-        assert "BigQuery" in COMPATIBILITY_MATRIX["storage"]
-        assert "MongoDB" in COMPATIBILITY_MATRIX["storage"]
-        
-        # Transformation
-        assert "dbt" in COMPATIBILITY_MATRIX["transformation"]
-        assert "Spark" in COMPATIBILITY_MATRIX["transformation"]
+        assert provider in COMPATIBILITY_MATRIX[category]
     
     def test_get_provider_info(self):
         """Test getting provider information."""
@@ -47,33 +64,23 @@ class TestCompatibilityMatrix:
         assert postgres_info["works_with_all"] is True
         assert "Metabase" in postgres_info["compatible_visualization"]
     
-    def test_compatible_pairs(self):
-        """Test compatible provider pairs."""
-        # PostgreSQL + dbt should be compatible
-        assert is_compatible("storage", "PostgreSQL", "transformation", "dbt") is True
-        
-        # PostgreSQL + Metabase should be compatible
-        assert is_compatible("storage", "PostgreSQL", "visualization", "Metabase") is True
-        
-        # DLT + PostgreSQL should be compatible
-        assert is_compatible("ingestion", "DLT", "storage", "PostgreSQL") is True
-    
-    def test_incompatible_pairs(self):
-        """Test incompatible provider pairs."""
-        # Kafka + dbt should be incompatible
-        assert is_compatible("ingestion", "Kafka", "transformation", "dbt") is False
-        
-        # MongoDB + dbt should be incompatible
-        assert is_compatible("storage", "MongoDB", "transformation", "dbt") is False
-        
-        # MongoDB + Great Expectations should be incompatible
-        assert is_compatible("storage", "MongoDB", "quality", "Great Expectations") is False
+    @pytest.mark.parametrize("cat1,prov1,cat2,prov2,expected", [
+        ("storage", "PostgreSQL", "transformation", "dbt", True),
+        ("storage", "PostgreSQL", "visualization", "Metabase", True),
+        ("ingestion", "DLT", "storage", "PostgreSQL", True),
+        ("ingestion", "Kafka", "transformation", "dbt", False),
+        ("storage", "MongoDB", "transformation", "dbt", False),
+        ("storage", "MongoDB", "quality", "Great Expectations", False),
+    ])
+    def test_provider_pairs(self, cat1, prov1, cat2, prov2, expected):
+        """Test known compatible and incompatible provider pairs."""
+        assert is_compatible(cat1, prov1, cat2, prov2) is expected
 
 
 class TestStackValidator:
     """Tests for the StackValidator."""
     
-    def test_valid_stack_postgres_dbt_metabase(self):
+    def test_valid_stack_postgres_dbt_metabase(self, validator):
         """Test validation of a valid stack."""
         stack = {
             "ingestion": "DLT",
@@ -85,12 +92,12 @@ class TestStackValidator:
             "monitoring": "Prometheus"
         }
         
-        is_valid, errors, warnings = StackValidator.validate_stack(stack)
+        is_valid, errors, warnings = validator(stack)
         
         assert is_valid is True
         assert len(errors) == 0
     
-    def test_invalid_stack_kafka_dbt(self):
+    def test_invalid_stack_kafka_dbt(self, validator):
         """Test validation catches Kafka + dbt incompatibility."""
         stack = {
             "ingestion": "Kafka",
@@ -98,60 +105,62 @@ class TestStackValidator:
             "transformation": "dbt"
         }
         
-        is_valid, errors, warnings = StackValidator.validate_stack(stack)
+        is_valid, errors, warnings = validator(stack)
         
         assert is_valid is False
         assert len(errors) > 0
         assert any("Kafka" in err and "dbt" in err for err in errors)
     
-    def test_invalid_stack_mongodb_dbt(self):
+    def test_invalid_stack_mongodb_dbt(self, validator):
         """Test validation catches MongoDB + dbt incompatibility."""
         stack = {
             "storage": "MongoDB",
             "transformation": "dbt"
         }
         
-        is_valid, errors, warnings = StackValidator.validate_stack(stack)
+        is_valid, errors, warnings = validator(stack)
         
         assert is_valid is False
         assert len(errors) > 0
         assert any("MongoDB" in err and "dbt" in err for err in errors)
     
-    def test_missing_storage(self):
+    def test_missing_storage(self, validator):
         """Test validation requires storage."""
         stack = {
             "ingestion": "DLT",
             "transformation": "dbt"
         }
         
-        is_valid, errors, warnings = StackValidator.validate_stack(stack)
+        is_valid, errors, warnings = validator(stack)
         
         assert is_valid is False
-        assert any("Storage" in err or "storage" in err for err in errors)
+        blob = "\n".join(errors)
+        assert "Storage" in blob or "storage" in blob
     
-    def test_visualization_requires_storage(self):
+    def test_visualization_requires_storage(self, validator):
         """Test that visualization requires storage."""
         stack = {
             "visualization": "Metabase"
         }
         
-        is_valid, errors, warnings = StackValidator.validate_stack(stack)
+        is_valid, errors, warnings = validator(stack)
         
         assert is_valid is False
-        assert any("storage" in err.lower() for err in errors)
+        assert "storage" in "\n".join(errors).lower()
     
-    def test_cloud_storage_warning(self):
+    def test_cloud_storage_warning(self, validator):
         """Test warning for cloud storage without Terraform."""
         stack = {
             "storage": "Snowflake",
             "transformation": "dbt"
         }
         
-        is_valid, errors, warnings = StackValidator.validate_stack(stack)
+        is_valid, errors, warnings = validator(stack)
         
         assert is_valid is True  # Valid but has warning
         assert len(warnings) > 0
-        assert any("Terraform" in warn or "cloud" in warn.lower() for warn in warnings)
+        blob = "\n".join(warnings)
+        assert "Terraform" in blob or "cloud" in blob.lower()
     
     def test_suggest_compatible_options(self):
         """Test suggesting compatible providers."""
@@ -175,6 +184,23 @@ class TestStackValidator:
         assert "dbt" not in compatible
         assert "Spark" in compatible  # Spark works with MongoDB
     
+    def test_suggestions_match_pairwise_checks(self):
+        """Test that suggestions equal a pairwise is_compatible filter for every two-tool stack."""
+        categories = list(COMPATIBILITY_MATRIX)
+        for cat_a in categories:
+            for cat_b in categories:
+                if cat_a == cat_b:
+                    continue
+                for prov_a in COMPATIBILITY_MATRIX[cat_a]:
+                    for prov_b in COMPATIBILITY_MATRIX[cat_b]:
+                        stack = {cat_a: prov_a, cat_b: prov_b}
+                        for target in categories:
+                            expected = [
+                                prov for prov in COMPATIBILITY_MATRIX[target]
+                                if all(is_compatible(target, prov, c, p) for c, p in stack.items())
+                            ]
+                            assert StackValidator.suggest_compatible_options(stack, target) == expected
+    
     def test_get_recommendation(self):
         """Test getting recommendation for a category."""
         stack = {
@@ -202,7 +228,7 @@ class TestStackValidator:
 class TestIntegration:
     """Integration tests combining validator with matrix."""
     
-    def test_complete_data_stack(self):
+    def test_complete_data_stack(self, validator):
         """Test a complete, production-ready stack."""
         stack = {
             "ingestion": "DLT",
@@ -215,13 +241,13 @@ class TestIntegration:
             "monitoring": "Prometheus"
         }
         
-        is_valid, errors, warnings = StackValidator.validate_stack(stack)
+        is_valid, errors, warnings = validator(stack)
         
         assert is_valid is True
         assert len(errors) == 0
         # May have warnings about cloud/credentials
     
-    def test_streaming_stack(self):
+    def test_streaming_stack(self, validator):
         """Test a streaming-focused stack."""
         stack = {
             "ingestion": "Kafka",
@@ -230,11 +256,11 @@ class TestIntegration:
             "orchestration": "Airflow"
         }
         
-        is_valid, errors, warnings = StackValidator.validate_stack(stack)
+        is_valid, errors, warnings = validator(stack)
         
         assert is_valid is True
     
-    def test_nosql_stack(self):
+    def test_nosql_stack(self, validator):
         """Test a NoSQL-focused stack."""
         stack = {
             "storage": "MongoDB",
@@ -243,7 +269,7 @@ class TestIntegration:
             "quality": "Soda"  # Not Great Expectations
         }
         
-        is_valid, errors, warnings = StackValidator.validate_stack(stack)
+        is_valid, errors, warnings = validator(stack)
         
         assert is_valid is True
 
@@ -2,12 +2,10 @@
 Tests for Cloud Deployers
 """
 
+import importlib
 import pytest
 from pathlib import Path
-import tempfile
-import shutil
-from core.deployers.base import CloudDeployer, Deployment Result, DeploymentStatus
-from core.updater import ProjectMetadata
+from core.deployers.base import CloudDeployer, DeploymentResult, DeploymentStatus
 
 
 class MockCloudDeployer(CloudDeployer):
@@ -65,23 +63,17 @@ class TestDeploymentResult:
 class TestCloudDeployer:
     """Test CloudDeployer base class"""
     
-    @pytest.fixture
-    def sample_project(self):
-        """Create a sample project for testing"""
-        from core.engine import TemplateEngine
-        import uuid
-        
-        temp_dir = Path(tempfile.mkdtemp(prefix="deploy_test_"))
+    @pytest.fixture(scope="session")
+    def sample_project(self, template_engine, fast_tmp_root):
+        """Create a sample project once; the tests only read it"""
+        project_dir = fast_tmp_root / "deploy_test"
         
         # Generate project
-        engine = TemplateEngine()
         stack = {"storage": "PostgreSQL"}
-        vfs = engine.generate("test_project", stack, str(uuid.uuid4()))
-        vfs.flush(str(temp_dir))
-        
-        yield temp_dir
+        vfs = template_engine.generate("test_project", stack, "deploy-test")
+        vfs.flush(str(project_dir))
         
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        return project_dir
     
     def test_init_valid_project(self, sample_project):
         """Test initialization with valid project"""
@@ -137,40 +129,18 @@ class TestCloudDeployer:
         assert status["status"] == "running"
 
 
-class TestAWSDeployer:
-    """Test AWS deployer (mocked)"""
-    
-    def test_import_aws_deployer(self):
-        """Test importing AWS deployer"""
-        try:
-            from core.deployers.aws_deployer import AWSDeployer
-            assert AWSDeployer is not None
-        except ImportError as e:
-            # boto3 might not be installed
-            assert "boto3" in str(e)
-
-
-class TestGCPDeployer:
-    """Test GCP deployer (mocked)"""
-    
-    def test_import_gcp_deployer(self):
-        """Test importing GCP deployer"""
-        try:
-            from core.deployers.gcp_deployer import GCPDeployer
-            assert GCPDeployer is not None
-        except ImportError as e:
-            # google-cloud might not be installed
-            assert "google" in str(e).lower()
-
-
-class TestAzureDeployer:
-    """Test Azure deployer (mocked)"""
-    
-    def test_import_azure_deployer(self):
-        """Test importing Azure deployer"""
+class TestProviderDeployers:
+    """Test the cloud-specific deployers (SDKs may be missing)"""
+    
+    @pytest.mark.parametrize("module,cls,needle", [
+        ("core.deployers.aws_deployer", "AWSDeployer", "boto3"),
+        ("core.deployers.gcp_deployer", "GCPDeployer", "google"),
+        ("core.deployers.azure_deployer", "AzureDeployer", "azure"),
+    ], ids=["aws", "gcp", "azure"])
+    def test_import_deployer(self, module, cls, needle):
+        """Test importing a deployer, or failing only on its cloud SDK"""
         try:
-            from core.deployers.azure_deployer import AzureDeployer
-            assert AzureDeployer is not None
+            mod = importlib.import_module(module)
+            assert getattr(mod, cls) is not None
         except ImportError as e:
-            # azure-mgmt might not be installed
-            assert "azure" in str(e).lower()
+            assert needle in str(e).lower()
@@ -7,72 +7,74 @@ from core.env_manager import EnvironmentManager
 from core.manifest import ProjectContext
 
 
+def _make_context() -> ProjectContext:
+    context = ProjectContext(
+        project_name="test_project",
+        project_id="test-123",
+        base_dir="/app"
+    )
+    
+    # Add some test environment variables
+    context.secrets = {
+        "postgres_password": "test_pass_123",
+        "airflow_secret": "airflow_secret_456"
+    }
+    
+    return context
+
+
+@pytest.fixture(scope="module")
+def env_files():
+    """Render every environment file once for the read-only checks"""
+    return EnvironmentManager.generate_all_env_files(_make_context())
+
+
 class TestEnvironmentManager:
     """Test suite for environment manager"""
     
     @pytest.fixture
     def context(self):
         """Create test project context"""
-        context = ProjectContext(
-            project_name="test_project",
-            project_id="test-123",
-            base_dir="/app"
-        )
-        
-        # Add some test environment variables
-        context.secrets = {
-            "postgres_password": "test_pass_123",
-            "airflow_secret": "airflow_secret_456"
-        }
-        
-        return context
-    
-    def test_generate_dev_env(self, context):
-        """Test development environment generation"""
-        dev_env = EnvironmentManager.generate_dev_env(context)
-        
-        assert dev_env is not None
-        assert "ENVIRONMENT=dev" in dev_env
-        assert "DEBUG=true" in dev_env
-        assert "LOG_LEVEL=DEBUG" in dev_env
-        assert "# Development Environment" in dev_env
-    
-    def test_generate_staging_env(self, context):
-        """Test staging environment generation"""
-        staging_env = EnvironmentManager.generate_staging_env(context)
-        
-        assert staging_env is not None
-        assert "ENVIRONMENT=staging" in staging_env
-        assert "DEBUG=false" in staging_env
-        assert "LOG_LEVEL=INFO" in staging_env
-        assert "USE_CLOUD_SECRETS=true" in staging_env
-        assert "# Staging Environment" in staging_env
+        return _make_context()
     
-    def test_generate_prod_env(self, context):
-        """Test production environment generation"""
-        prod_env = EnvironmentManager.generate_prod_env(context)
-        
-        assert prod_env is not None
-        assert "ENVIRONMENT=prod" in prod_env
-        assert "DEBUG=false" in prod_env
-        assert "LOG_LEVEL=WARNING" in prod_env
-        assert "USE_CLOUD_SECRETS=true" in prod_env
-        assert "ENABLE_MONITORING=true" in prod_env
-        assert "⚠️  PRODUCTION ENVIRONMENT" in prod_env
+    @pytest.mark.parametrize("key,expected_lines", [
+        ("dev", [
+            "ENVIRONMENT=dev",
+            "DEBUG=true",
+            "LOG_LEVEL=DEBUG",
+            "# Development Environment",
+        ]),
+        ("staging", [
+            "ENVIRONMENT=staging",
+            "DEBUG=false",
+            "LOG_LEVEL=INFO",
+            "USE_CLOUD_SECRETS=true",
+            "# Staging Environment",
+        ]),
+        ("prod", [
+            "ENVIRONMENT=prod",
+            "DEBUG=false",
+            "LOG_LEVEL=WARNING",
+            "USE_CLOUD_SECRETS=true",
+            "ENABLE_MONITORING=true",
+            "⚠️  PRODUCTION ENVIRONMENT",
+        ]),
+        ("example", [
+            "CHANGE_ME",
+            "# Environment Variables Template",
+            "cp .env.example .env.dev",
+        ]),
+    ], ids=["dev", "staging", "prod", "example"])
+    def test_env_generated(self, env_files, key, expected_lines):
+        """Test each environment file contains its expected settings"""
+        body = env_files[key]
+        
+        assert body is not None
+        for line in expected_lines:
+            assert line in body
     
-    def test_generate_example_env(self, context):
-        """Test example .env file generation"""
-        example_env = EnvironmentManager.generate_example_env(context)
-        
-        assert example_env is not None
-        assert "CHANGE_ME" in example_env
-        assert "# Environment Variables Template" in example_env
-        assert "cp .env.example .env.dev" in example_env
-    
-    def test_generate_all_env_files(self, context):
+    def test_generate_all_env_files(self, env_files):
         """Test generating all environment files at once"""
-        env_files = EnvironmentManager.generate_all_env_files(context)
-        
         assert "dev" in env_files
         assert "staging" in env_files
         assert "prod" in env_files
@@ -153,16 +155,16 @@ class TestEnvironmentManager:
         assert "token789" not in example
         assert "CHANGE_ME" in example
     
-    def test_dev_env_uses_localhost(self, context):
+    def test_dev_env_uses_localhost(self, env_files):
         """Test that dev environment uses localhost for services"""
-        dev_env = EnvironmentManager.generate_dev_env(context)
+        dev_env = env_files["dev"]
         
         # Dev should prefer local services
         assert "localhost" in dev_env or "postgres" in dev_env  # Docker service names
     
-    def test_prod_env_uses_placeholders(self, context):
+    def test_prod_env_uses_placeholders(self, env_files):
         """Test that prod environment uses placeholders for cloud resources"""
-        prod_env = EnvironmentManager.generate_prod_env(context)
+        prod_env = env_files["prod"]
         
         # Prod should use environment variable placeholders
         assert "${" in prod_env or "CHANGE_ME" in prod_env
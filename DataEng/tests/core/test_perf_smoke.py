@@ -0,0 +1,52 @@
+"""
+Performance smoke tests for hot production paths.
+
+Guards SecretRegistry.get_secrets_for_stack and ConfigurationProfile.save
+against regressions (requires pytest-benchmark). Compare against the last
+saved run with:
+
+    make test-bench
+
+The module is marked `benchmark`, which pytest.ini deselects by default.
+"""
+
+import pytest
+
+from core.profiles import ConfigurationProfile
+from core.secret_registry import SecretRegistry
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+
+STACK = {
+    "ingestion": "DLT",
+    "storage": "PostgreSQL",
+    "transformation": "dbt",
+    "orchestration": "Airflow",
+    "visualization": "Metabase",
+    "quality": "Great Expectations",
+    "monitoring": "Prometheus"
+}
+
+
+@pytest.mark.slow
+class TestPerfSmoke:
+    """Benchmarks for the profile and secret generation hot paths"""
+    
+    def test_get_secrets_for_stack(self, benchmark):
+        """Benchmark secret generation for a full PostgreSQL stack"""
+        secrets = benchmark(SecretRegistry.get_secrets_for_stack, STACK, "bench")
+        
+        assert "postgres_password" in secrets
+    
+    def test_profile_save(self, benchmark, tmp_path, monkeypatch):
+        """Benchmark saving (overwriting) a profile on disk"""
+        monkeypatch.setattr(ConfigurationProfile, "PROFILES_DIR", tmp_path)
+        
+        profile = benchmark(
+            ConfigurationProfile.save, "bench", STACK, "Benchmark profile", overwrite=True
+        )
+        
+        assert profile.stack == STACK
@@ -3,22 +3,54 @@ Tests for Configuration Profiles System
 """
 
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
+from core import profiles
 from core.profiles import ConfigurationProfile, StackProfile
 
+# Shares the preloaded profiles and the patched PROFILES_DIR on one worker
+pytestmark = pytest.mark.xdist_group("profiles")
+
+
+@pytest.fixture(scope="module")
+def preset_names():
+    """Built-in preset names, read once per module"""
+    return set(ConfigurationProfile.get_preset_names())
+
+
+# User profiles written once and shared by the read-only list/search tests
+PRELOADED_PROFILES = [
+    ("pg_local", {"storage": "PostgreSQL"}, "Local PostgreSQL", ["local", "sql"]),
+    ("mongo_local", {"storage": "MongoDB"}, "Local MongoDB", ["local", "nosql"]),
+    ("sf_cloud", {"storage": "Snowflake"}, "Cloud Snowflake", ["cloud", "sql"]),
+]
+
+
+@pytest.fixture(scope="session")
+def profiles_root(tmp_path_factory):
+    """Create one profiles directory shared by the whole session"""
+    return tmp_path_factory.mktemp("antigravity_profiles_")
+
+
+@pytest.fixture(scope="module")
+def preloaded_profiles(profiles_root):
+    """Save PRELOADED_PROFILES once and point PROFILES_DIR at them"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(ConfigurationProfile, "PROFILES_DIR", profiles_root / "preloaded")
+        for name, stack, description, tags in PRELOADED_PROFILES:
+            ConfigurationProfile.save(name, stack, description, tags=tags)
+        yield {name for name, _, _, _ in PRELOADED_PROFILES}
+
 
 class TestConfigurationProfile:
     """Test suite for configuration profiles"""
     
     @pytest.fixture
-    def temp_profiles_dir(self, monkeypatch):
-        """Create temporary profiles directory"""
-        temp_dir = Path(tempfile.mkdtemp(prefix="antigravity_profiles_"))
-        monkeypatch.setattr(ConfigurationProfile, "PROFILESDIR", temp_dir)
-        yield temp_dir
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    def temp_profiles_dir(self, fs, monkeypatch):
+        """Point PROFILES_DIR at an in-memory directory (pyfakefs)"""
+        temp_dir = Path("/profiles")
+        fs.create_dir(temp_dir)
+        monkeypatch.setattr(ConfigurationProfile, "PROFILES_DIR", temp_dir)
+        return temp_dir
     
     def test_save_and_load_profile(self, temp_profiles_dir):
         """Test saving and loading a profile"""
@@ -42,26 +74,39 @@ class TestConfigurationProfile:
         assert loaded.name == "test_profile"
         assert loaded.stack == stack
     
-    def test_list_profiles(self, temp_profiles_dir):
-        """Test listing profiles"""
-        # Save a few profiles
-        ConfigurationProfile.save("profile1", {"storage": "PostgreSQL"}, "First")
-        ConfigurationProfile.save("profile2", {"storage": "Snowflake"}, "Second")
-        
-        profiles = ConfigurationProfile.list_profiles(include_presets=False)
-        
-        assert "profile1" in profiles
-        assert "profile2" in profiles
+    @pytest.mark.parametrize("list_fn, item_type, name_of", [
+        (ConfigurationProfile.list_profiles, str, lambda name: name),
+        (ConfigurationProfile.list_detailed, StackProfile, lambda profile: profile.name),
+    ], ids=["list_profiles", "list_detailed"])
+    def test_list(self, preloaded_profiles, list_fn, item_type, name_of):
+        """Test listing user profiles, by name and with full details"""
+        listed = list_fn(include_presets=False)
+        
+        assert all(isinstance(item, item_type) for item in listed)
+        assert {name_of(item) for item in listed} == preloaded_profiles
+    
+    @pytest.mark.parametrize("query, tags, expected", [
+        ("postgres", None, {"pg_local"}),
+        ("", ["cloud"], {"sf_cloud"}),
+        ("", ["local"], {"pg_local", "mongo_local"}),
+        ("snowflake", ["sql"], {"sf_cloud"}),
+    ], ids=["query", "tag", "shared-tag", "query-and-tag"])
+    def test_search(self, preloaded_profiles, query, tags, expected):
+        """Test searching user profiles by query and tags"""
+        results = ConfigurationProfile.search(query=query, tags=tags)
+        
+        # search() also covers the built-in presets; only user profiles are checked
+        assert {p.name for p in results if not ConfigurationProfile.is_preset(p.name)} == expected
     
-    def test_builtin_presets_exist(self):
+    def test_builtin_presets_exist(self, preset_names):
         """Test that built-in presets are available"""
-        presets = ConfigurationProfile.get_preset_names()
-        
-        assert "modern_data_stack" in presets
-        assert "analytics_starter" in presets
-        assert "streaming_platform" in presets
-        assert "ml_platform" in presets
-        assert "data_lakehouse" in presets
+        assert {
+            "modern_data_stack",
+            "analytics_starter",
+            "streaming_platform",
+            "ml_platform",
+            "data_lakehouse",
+        } <= preset_names
     
     def test_load_builtin_preset(self):
         """Test loading a built-in preset"""
@@ -119,28 +164,19 @@ class TestConfigurationProfile:
         loaded = ConfigurationProfile.load("tagged")
         assert loaded.tags == ["test", "postgres", "local"]
     
-    def test_search_by_query(self, temp_profiles_dir):
-        """Test searching profiles by query"""
-        ConfigurationProfile.save("pg_local", {"storage": "PostgreSQL"}, "Local PostgreSQL")
-        ConfigurationProfile.save("sf_cloud", {"storage": "Snowflake"}, "Cloud Snowflake")
-        
-        results = ConfigurationProfile.search(query="postgres")
-        
-        assert len(results) == 1
-        assert results[0].name == "pg_local"
-    
-    def test_search_by_tags(self, temp_profiles_dir):
-        """Test searching profiles by tags"""
-        ConfigurationProfile.save("p1", {"storage": "PostgreSQL"}, "First", tags=["local", "sql"])
-        ConfigurationProfile.save("p2", {"storage": "MongoDB"}, "Second", tags=["local", "nosql"])
-        ConfigurationProfile.save("p3", {"storage": "Snowflake"}, "Third", tags=["cloud", "sql"])
+    def test_save_and_load_without_orjson(self, temp_profiles_dir, monkeypatch):
+        """Test the stdlib json fallback writes files orjson can read back"""
+        stack = {"storage": "PostgreSQL", "transformation": "dbt"}
         
-        results = ConfigurationProfile.search(tags=["cloud"])
+        with monkeypatch.context() as mp:
+            mp.setattr(profiles, "orjson", None)
+            ConfigurationProfile.save("fallback", stack, "Stdlib json", tags=["json"])
         
-        assert len(results) == 1
-        assert results[0].name == "p3"
+        loaded = ConfigurationProfile.load("fallback")
+        assert loaded.stack == stack
+        assert loaded.tags == ["json"]
     
-    def test_export_and_import_profile(self, temp_profiles_dir, tmp_path):
+    def test_export_and_import_profile(self, temp_profiles_dir):
         """Test exporting and importing profiles"""
         # Create and save a profile
         ConfigurationProfile.save(
@@ -151,7 +187,7 @@ class TestConfigurationProfile:
         )
         
         # Export it
-        export_path = tmp_path / "exported_profile.json"
+        export_path = temp_profiles_dir.parent / "exported_profile.json"
         ConfigurationProfile.export_profile("export_test", export_path)
         
         assert export_path.exists()
@@ -166,20 +202,11 @@ class TestConfigurationProfile:
         assert imported.stack["storage"] == "PostgreSQL"
         assert imported.tags == ["test"]
     
-    def test_list_detailed(self, temp_profiles_dir):
-        """Test listing profiles with full details"""
-        ConfigurationProfile.save("detailed1", {"storage": "PostgreSQL"}, "First")
-        ConfigurationProfile.save("detailed2", {"storage": "Snowflake"}, "Second")
-        
-        profiles = ConfigurationProfile.list_detailed(include_presets=False)
-        
-        assert len(profiles) >= 2
-        assert all(isinstance(p, StackProfile) for p in profiles)
-    
-    def test_is_preset(self):
+    def test_is_preset(self, preset_names):
         """Test checking if profile is a preset"""
         assert ConfigurationProfile.is_preset("modern_data_stack") is True
         assert ConfigurationProfile.is_preset("analytics_starter") is True
+        assert all(ConfigurationProfile.is_preset(name) for name in preset_names)
         assert ConfigurationProfile.is_preset("nonexistent") is False
     
     def test_profile_timestamps(self, temp_profiles_dir):
@@ -2,6 +2,7 @@
 Tests for core.registry module (ProviderRegistry).
 """
 
+import contextlib
 import pytest
 from core.registry import ProviderRegistry
 from core.interfaces import ComponentGenerator
@@ -21,30 +22,57 @@ class MockProvider(ComponentGenerator):
         return {}
 
 
+@contextlib.contextmanager
+def _restored_registry():
+    """Snapshots ProviderRegistry._registry and restores it on exit"""
+    saved = {category: dict(tools) for category, tools in ProviderRegistry._registry.items()}
+    try:
+        yield
+    finally:
+        for category, tools in ProviderRegistry._registry.items():
+            tools.clear()
+            tools.update(saved.get(category, {}))
+        ProviderRegistry.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def _snapshot_registry():
+    """Restores ProviderRegistry._registry after each test, so tests can register freely"""
+    with _restored_registry():
+        yield
+
+
 class TestProviderRegistry:
     """Tests for ProviderRegistry class."""
     
     @pytest.mark.unit
     def test_registry_has_categories(self):
         """Test that registry initializes with expected categories."""
-        categories = ProviderRegistry._registry.keys()
+        expected = {"ingestion", "storage", "transformation", "orchestration", "infrastructure"}
         
-        assert "ingestion" in categories
-        assert "storage" in categories
-        assert "transformation" in categories
-        assert "orchestration" in categories
-        assert "infrastructure" in categories
+        assert expected <= ProviderRegistry._registry.keys()
     
     @pytest.mark.unit
     def test_register_provider(self):
         """Test registering a new provider."""
-        # Note: This modifies global registry, so use unique name
         ProviderRegistry.register("storage", "TestStorage", MockProvider)
         
         provider_cls = ProviderRegistry.get_provider("storage", "TestStorage")
         
         assert provider_cls == MockProvider
     
+    @pytest.mark.unit
+    def test_get_provider_cache_refreshed_on_register(self):
+        """Test that re-registering a name replaces the memoized lookup."""
+        ProviderRegistry.register("storage", "TestStorage", MockProvider)
+        assert ProviderRegistry.get_provider("storage", "TestStorage") is MockProvider
+        
+        class OtherProvider(MockProvider):
+            pass
+        
+        ProviderRegistry.register("storage", "TestStorage", OtherProvider)
+        assert ProviderRegistry.get_provider("storage", "TestStorage") is OtherProvider
+    
     @pytest.mark.unit
     def test_register_invalid_category_raises_error(self):
         """Test that registering to invalid category raises ValueError."""
@@ -70,16 +98,46 @@ class TestProviderRegistry:
         assert all(isinstance(providers[cat], list) for cat in providers)
     
     @pytest.mark.unit
-    def test_get_all_providers_includes_registered(self):
-        """Test that get_all_providers includes registered providers."""
-        # Import providers to trigger registration
-        from core.providers import ingestion, storage, transformation, orchestration, infrastructure
+    def test_get_all_providers_returns_independent_copies(self):
+        """Test that mutating the returned dict does not affect later calls."""
+        providers = ProviderRegistry.get_all_providers()
+        providers["storage"].append("Mutated")
+        providers["ingestion"] = []
+        
+        fresh = ProviderRegistry.get_all_providers()
+        assert fresh is not providers
+        assert "Mutated" not in fresh["storage"]
+        assert fresh["ingestion"] == list(ProviderRegistry._registry["ingestion"])
+    
+    @pytest.mark.unit
+    def test_register_invalidates_providers_view(self):
+        """Test that registering a provider refreshes the cached names."""
+        assert "MockMonitoring" not in ProviderRegistry.get_all_providers()["monitoring"]
+        ProviderRegistry.register("monitoring", "MockMonitoring", MockProvider)
+        
+        assert "MockMonitoring" in ProviderRegistry.get_all_providers()["monitoring"]
+    
+    @pytest.mark.unit
+    def test_registry_snapshot_restores_registrations(self):
+        """Test that registrations made inside a snapshot are rolled back."""
+        with _restored_registry():
+            ProviderRegistry.register("storage", "LeakCheckStorage", MockProvider)
+            assert "LeakCheckStorage" in ProviderRegistry.get_all_providers()["storage"]
         
+        assert "LeakCheckStorage" not in ProviderRegistry.get_all_providers()["storage"]
+    
+    @pytest.mark.unit
+    def test_get_all_providers_includes_registered(self, providers_loaded):
+        """Test that get_all_providers includes registered providers."""
         providers = ProviderRegistry.get_all_providers()
         
-        # Check for known providers
-        assert "DLT" in providers["ingestion"]
-        assert "PostgreSQL" in providers["storage"]
-        assert "dbt" in providers["transformation"]
-        assert "Airflow" in providers["orchestration"]
-        assert "terraform" in providers["infrastructure"]
+        # Check for known providers; the assertion lists any that are missing
+        expected = {
+            "ingestion": "DLT",
+            "storage": "PostgreSQL",
+            "transformation": "dbt",
+            "orchestration": "Airflow",
+            "infrastructure": "terraform",
+        }
+        missing = {cat: name for cat, name in expected.items() if name not in providers[cat]}
+        assert not missing
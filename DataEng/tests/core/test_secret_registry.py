@@ -1,35 +1,82 @@
 """
 Tests for Secret Registry and Auto-Wiring
 """
+import string
+
 import pytest
-from backend.core.secret_registry import (
+from core.secret_registry import (
     SecretRegistry,
     generate_secure_password,
     generate_secret_key,
     generate_username
 )
 
+PASSWORD_CHARS = frozenset(string.ascii_letters + string.digits + "!@#$%^&*")
+HEX_CHARS = frozenset("0123456789abcdef")
+
+
+@pytest.fixture(scope="module")
+def seen_passwords():
+    """Passwords generated so far in this module, for uniqueness checks"""
+    return set()
+
+
+@pytest.fixture(scope="module")
+def postgres_stack_secrets():
+    """Secrets for a full PostgreSQL stack, generated once per module"""
+    stack = {
+        "ingestion": "DLT",
+        "storage": "PostgreSQL",
+        "transformation": "dbt",
+        "orchestration": "Airflow",
+        "visualization": "Metabase",
+        "quality": "Great Expectations",
+        "monitoring": "Prometheus"
+    }
+    return SecretRegistry.get_secrets_for_stack(stack, "test_project")
+
+
+@pytest.fixture(scope="module")
+def snowflake_stack_secrets():
+    """Secrets for a Snowflake stack, generated once per module"""
+    stack = {
+        "storage": "Snowflake",
+        "transformation": "dbt",
+        "visualization": "Superset",
+        "quality": "Soda"
+    }
+    return SecretRegistry.get_secrets_for_stack(stack, "analytics")
+
 
 class TestSecretGeneration:
     """Tests for secret generation functions."""
     
-    def test_generate_secure_password(self):
+    def test_generate_secure_password(self, seen_passwords):
         """Test password generation."""
-        password = generate_secure_password(16)
-        
-        assert len(password) == 16
-        assert password.isalnum() or any(c in "!@#$%^&*" for c in password)
+        for _ in range(2):
+            password = generate_secure_password(16)
+            
+            assert len(password) == 16
+            assert set(password) <= PASSWORD_CHARS
+            
+            # Test uniqueness against every password generated so far
+            assert password not in seen_passwords
+            seen_passwords.add(password)
+    
+    @pytest.mark.parametrize("length", [0, 1, 12, 20, 256])
+    def test_generate_secure_password_length(self, length):
+        """Test that batched generation returns exactly the requested length."""
+        password = generate_secure_password(length)
         
-        # Test uniqueness
-        password2 = generate_secure_password(16)
-        assert password != password2
+        assert len(password) == length
+        assert set(password) <= PASSWORD_CHARS
     
     def test_generate_secret_key(self):
         """Test secret key generation."""
         key = generate_secret_key(32)
         
         assert len(key) == 64  # Hex doubles the length
-        assert all(c in "0123456789abcdef" for c in key)
+        assert set(key) <= HEX_CHARS
         
         # Test uniqueness
         key2 = generate_secret_key(32)
@@ -46,73 +93,53 @@ class TestSecretRegistry:
     
     def test_registry_has_all_secrets(self):
         """Test that registry defines all expected secrets."""
-        assert "postgres_user" in SecretRegistry.SECRETS
-        assert "postgres_password" in SecretRegistry.SECRETS
-        assert "snowflake_account" in SecretRegistry.SECRETS
-        assert "metabase_db_password" in SecretRegistry.SECRETS
-        assert "superset_secret_key" in SecretRegistry.SECRETS
-        assert "airflow_fernet_key" in SecretRegistry.SECRETS
+        expected = {
+            "postgres_user",
+            "postgres_password",
+            "snowflake_account",
+            "metabase_db_password",
+            "superset_secret_key",
+            "airflow_fernet_key",
+        }
+        assert expected <= SecretRegistry.SECRETS.keys()
     
-    def test_get_secrets_for_postgres_stack(self):
+    def test_get_secrets_for_postgres_stack(self, postgres_stack_secrets):
         """Test secret generation for PostgreSQL stack."""
-        stack = {
-            "storage": "PostgreSQL",
-            "transformation": "dbt",
-            "visualization": "Metabase"
-        }
-        
-        secrets = SecretRegistry.get_secrets_for_stack(stack, "test_project")
+        secrets = postgres_stack_secrets
         
         # PostgreSQL secrets
-        assert "postgres_user" in secrets
-        assert "postgres_password" in secrets
-        assert "postgres_database" in secrets
+        assert {"postgres_user", "postgres_password", "postgres_database"} <= secrets.keys()
         assert secrets["postgres_database"] == "test_project_warehouse"
         
         # Metabase secrets
-        assert "metabase_db_password" in secrets
-        assert "metabase_encryption_key" in secrets
+        assert {"metabase_db_password", "metabase_encryption_key"} <= secrets.keys()
         
         # Passwords should be generated (not placeholders)
         assert secrets["postgres_password"] != "CHANGE_ME_POSTGRES_PASSWORD"
         assert len(secrets["postgres_password"]) == 16
     
-    def test_get_secrets_for_snowflake_stack(self):
+    def test_get_secrets_for_snowflake_stack(self, snowflake_stack_secrets):
         """Test secret generation for Snowflake stack."""
-        stack = {
-            "storage": "Snowflake",
-            "transformation": "dbt",
-            "visualization": "Superset"
-        }
-        
-        secrets = SecretRegistry.get_secrets_for_stack(stack, "analytics")
+        secrets = snowflake_stack_secrets
         
         # Snowflake secrets
-        assert "snowflake_account" in secrets
-        assert "snowflake_user" in secrets
-        assert "snowflake_password" in secrets
-        assert "snowflake_warehouse" in secrets
+        assert {
+            "snowflake_account",
+            "snowflake_user",
+            "snowflake_password",
+            "snowflake_warehouse",
+        } <= secrets.keys()
         
         # Superset secrets
-        assert "superset_secret_key" in secrets
-        assert "superset_db_password" in secrets
+        assert {"superset_secret_key", "superset_db_password"} <= secrets.keys()
         
         # Password should be strong (20 chars for Snowflake)
         assert len(secrets["snowflake_password"]) == 20
     
-    def test_auto_wiring_same_password(self):
+    def test_auto_wiring_same_password(self, postgres_stack_secrets):
         """Test that components share the same password automatically."""
-        stack = {
-            "storage": "PostgreSQL",
-            "transformation": "dbt",
-            "visualization": "Metabase",
-            "quality": "Great Expectations"
-        }
-        
-        secrets = SecretRegistry.get_secrets_for_stack(stack, "project")
-        
         # All these components should use the SAME postgres password
-        postgres_password = secrets["postgres_password"]
+        postgres_password = postgres_stack_secrets["postgres_password"]
         
         # Verify it's a strong password
         assert len(postgres_password) == 16
@@ -183,19 +210,9 @@ class TestSecretRegistry:
 class TestAutoWiringScenarios:
     """Integration tests for auto-wiring scenarios."""
     
-    def test_full_postgres_stack_autowiring(self):
+    def test_full_postgres_stack_autowiring(self, postgres_stack_secrets):
         """Test complete PostgreSQL stack with auto-wired secrets."""
-        stack = {
-            "ingestion": "DLT",
-            "storage": "PostgreSQL",
-            "transformation": "dbt",
-            "orchestration": "Airflow",
-            "visualization": "Metabase",
-            "quality": "Great Expectations",
-            "monitoring": "Prometheus"
-        }
-        
-        secrets = SecretRegistry.get_secrets_for_stack(stack, "my_project")
+        secrets = postgres_stack_secrets
         
         # All these should share the PostgreSQL password
         pg_password = secrets["postgres_password"]
@@ -206,24 +223,15 @@ class TestAutoWiringScenarios:
         ge_conn = SecretRegistry.get_connection_string("PostgreSQL", secrets, "quality")
         
         # All should use the SAME password
-        assert pg_password in dbt_conn
-        assert pg_password in metabase_conn
-        assert pg_password in ge_conn
+        assert all(pg_password in conn for conn in (dbt_conn, metabase_conn, ge_conn))
         
         # Airflow should have its own admin password
         assert "airflow_admin_password" in secrets
         assert secrets["airflow_admin_password"] != pg_password
     
-    def test_snowflake_stack_autowiring(self):
+    def test_snowflake_stack_autowiring(self, snowflake_stack_secrets):
         """Test Snowflake stack with auto-wired secrets."""
-        stack = {
-            "storage": "Snowflake",
-            "transformation": "dbt",
-            "visualization": "Superset",
-            "quality": "Soda"
-        }
-        
-        secrets = SecretRegistry.get_secrets_for_stack(stack, "analytics")
+        secrets = snowflake_stack_secrets
         
         # All should share Snowflake credentials
         sf_password = secrets["snowflake_password"]
@@ -3,22 +3,22 @@ Tests for Custom Template Support
 """
 
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 from core.template_loader import TemplateLoader, TemplateManager
 
+# Overrides patch the class-level USER_TEMPLATES; keep them on one worker
+pytestmark = pytest.mark.xdist_group("template_overrides")
+
 
 class TestTemplateLoader:
     """Test template loader functionality"""
     
     @pytest.fixture
-    def temp_user_templates(self, monkeypatch):
+    def temp_user_templates(self, tmp_path_factory, monkeypatch):
         """Create temporary user templates directory"""
-        temp_dir = Path(tempfile.mkdtemp(prefix="user_templates_"))
+        temp_dir = tmp_path_factory.mktemp("user_templates")
         monkeypatch.setattr(TemplateLoader, "USER_TEMPLATES", temp_dir)
-        yield temp_dir
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        return temp_dir
     
     def test_get_template_env(self):
         """Test creating Jinja2 environment"""
@@ -28,6 +28,43 @@ class TestTemplateLoader:
         assert env is not None
         assert env.loader is not None
     
+    def test_get_template_env_cached_until_override(self, temp_user_templates):
+        """Test that the environment is shared and rebuilt after an override"""
+        env = TemplateLoader().get_template_env()
+        assert TemplateLoader().get_template_env() is env
+        
+        TemplateLoader.override_template("common", "README.md.j2", b"custom content")
+        
+        rebuilt = TemplateLoader().get_template_env()
+        assert rebuilt is not env
+        assert rebuilt.get_template("common/README.md.j2").render() == "custom content"
+    
+    def test_get_template_env_sees_user_dir_created_later(self, tmp_path, monkeypatch):
+        """Test that a user template dir created outside the class is picked up"""
+        user_templates = tmp_path / "user_templates"
+        monkeypatch.setattr(TemplateLoader, "USER_TEMPLATES", user_templates)
+        env = TemplateLoader().get_template_env()
+        
+        (user_templates / "common").mkdir(parents=True)
+        (user_templates / "common" / "README.md.j2").write_text("edited elsewhere")
+        
+        rebuilt = TemplateLoader().get_template_env()
+        assert rebuilt is not env
+        assert rebuilt.get_template("common/README.md.j2").render() == "edited elsewhere"
+    
+    def test_get_template_env_sees_template_added_to_category(self, temp_user_templates):
+        """Test that an override written into an existing category dir is picked up"""
+        TemplateLoader.override_template("common", "other.j2", b"unrelated")
+        env = TemplateLoader().get_template_env()
+        default = env.get_template("common/README.md.j2")
+        assert Path(default.filename).is_relative_to(TemplateLoader.DEFAULT_TEMPLATES)
+        
+        (temp_user_templates / "common" / "README.md.j2").write_text("edited elsewhere")
+        
+        rebuilt = TemplateLoader().get_template_env()
+        assert rebuilt is not env
+        assert rebuilt.get_template("common/README.md.j2").render() == "edited elsewhere"
+    
     def test_override_template(self, temp_user_templates, tmp_path):
         """Test overriding a template"""
         # Create a custom template
@@ -44,13 +81,23 @@ class TestTemplateLoader:
         assert result_path.exists()
         assert "Custom Airflow DAG" in result_path.read_text()
     
-    def test_reset_template(self, temp_user_templates, tmp_path):
+    def test_override_template_from_content(self, temp_user_templates):
+        """Test overriding a template from in-memory content"""
+        result_path = TemplateLoader.override_template("common", "test.j2", b"custom content")
+        
+        assert result_path.read_text() == "custom content"
+    
+    def test_override_template_rejects_str(self, temp_user_templates):
+        """Test that a str source is refused rather than guessed at"""
+        with pytest.raises(TypeError):
+            TemplateLoader.override_template("common", "test.j2", "/some/custom.j2")
+        
+        assert not (temp_user_templates / "common" / "test.j2").exists()
+    
+    def test_reset_template(self, temp_user_templates):
         """Test resetting a template to default"""
         # First create an override
-        custom_template = tmp_path / "custom.j2"
-        custom_template.write_text("custom content")
-        
-        TemplateLoader.override_template("common", "test.j2", custom_template)
+        TemplateLoader.override_template("common", "test.j2", b"custom content")
         
         # Reset it
         assert TemplateLoader.reset_template("common", "test.j2") is True
@@ -58,18 +105,49 @@ class TestTemplateLoader:
         # Try resetting non-existent override
         assert TemplateLoader.reset_template("common", "nonexistent.j2") is False
     
-    def test_list_overrides(self, temp_user_templates, tmp_path):
+    def test_list_overrides(self, temp_user_templates):
         """Test listing user overrides"""
         # Create some overrides
         for i in range(3):
-            custom = tmp_path / f"custom{i}.j2"
-            custom.write_text(f"content {i}")
-            TemplateLoader.override_template("test", f"template{i}.j2", custom)
+            TemplateLoader.override_template("test", f"template{i}.j2", f"content {i}".encode())
         
         overrides = TemplateLoader.list_overrides()
         
         assert len(overrides) == 3
-        assert any("template0.j2" in o for o in overrides)
+        override_names = {Path(o).name for o in overrides}
+        assert {"template0.j2", "template1.j2", "template2.j2"} <= override_names
+    
+    def test_list_overrides_cache_invalidation(self, temp_user_templates):
+        """Test that overriding and resetting refresh the cached scan"""
+        assert TemplateLoader.list_overrides() == []
+        TemplateLoader.override_template("test", "cached.j2", b"custom")
+        assert TemplateLoader.list_overrides() == ["test/cached.j2"]
+        
+        TemplateLoader.list_overrides().clear()
+        assert TemplateLoader.list_overrides() == ["test/cached.j2"]
+        
+        TemplateLoader.reset_template("test", "cached.j2")
+        assert TemplateLoader.list_overrides() == []
+    
+    def test_list_overrides_sees_template_added_to_category(self, temp_user_templates):
+        """Test that a template written into an existing category dir is listed"""
+        TemplateLoader.override_template("test", "first.j2", b"custom")
+        assert TemplateLoader.list_overrides() == ["test/first.j2"]
+        
+        (temp_user_templates / "test" / "second.j2").write_text("added elsewhere")
+        
+        assert TemplateLoader.list_overrides() == ["test/first.j2", "test/second.j2"]
+    
+    def test_list_overrides_missing_dir_not_cached(self, tmp_path, monkeypatch):
+        """Test that a missing user dir does not pin an empty result"""
+        user_templates = tmp_path / "user_templates"
+        monkeypatch.setattr(TemplateLoader, "USER_TEMPLATES", user_templates)
+        assert TemplateLoader.list_overrides() == []
+        
+        (user_templates / "test").mkdir(parents=True)
+        (user_templates / "test" / "late.j2").write_text("custom")
+        
+        assert TemplateLoader.list_overrides() == ["test/late.j2"]
     
     def test_get_template_info_default_only(self):
         """Test getting info for default template"""
@@ -99,33 +177,27 @@ class TestTemplateLoader:
         assert output_file.exists()
         assert len(output_file.read_text()) > 0
     
-    def test_clear_all_overrides(self, temp_user_templates, tmp_path):
+    def test_clear_all_overrides(self, temp_user_templates):
         """Test clearing all overrides"""
         # Create overrides
         for i in range(5):
-            custom = tmp_path / f"custom{i}.j2"
-            custom.write_text(f"content {i}")
-            TemplateLoader.override_template("test", f"template{i}.j2", custom)
+            TemplateLoader.override_template("test", f"template{i}.j2", f"content {i}".encode())
         
         count = TemplateLoader.clear_all_overrides()
         
         assert count == 5
-assert len(TemplateLoader.list_overrides()) == 0
+        assert len(TemplateLoader.list_overrides()) == 0
 
 
 class TestTemplateManager:
     """Test template manager high-level interface"""
     
     @pytest.fixture
-    def manager(self, monkeypatch):
+    def manager(self, tmp_path_factory, monkeypatch):
         """Create template manager with temp user directory"""
-        temp_dir = Path(tempfile.mkdtemp(prefix="manager_templates_"))
+        temp_dir = tmp_path_factory.mktemp("manager_templates")
         monkeypatch.setattr(TemplateLoader, "USER_TEMPLATES", temp_dir)
-        
-        manager = TemplateManager()
-        yield manager
-        
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        return TemplateManager()
     
     def test_override_template(self, manager, tmp_path):
         """Test overriding via manager"""
@@ -135,7 +207,7 @@ class TestTemplateManager:
         manager.override("orchestration/airflow_dag.py.j2", custom)
         
         overrides = TemplateLoader.list_overrides()
-        assert any("airflow_dag.py.j2" in o for o in overrides)
+        assert "airflow_dag.py.j2" in {Path(o).name for o in overrides}
     
     def test_reset_template(self, manager, tmp_path):
         """Test resetting via manager"""
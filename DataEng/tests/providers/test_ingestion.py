@@ -27,32 +27,32 @@ class TestDLTGenerator:
         generator.generate(temp_output_dir, mock_config)
         
         # Check for generated files
-        expected_files = [
+        expected_files = {
             "ingestion_pipeline.py",
             "Dockerfile.ingestion"
-        ]
+        }
         
-        for filename in expected_files:
-            filepath = os.path.join(temp_output_dir, filename)
-            assert os.path.exists(filepath), f"Expected file {filename} not found"
+        entries = {entry.name for entry in os.scandir(temp_output_dir)}
+        missing = expected_files - entries
+        assert not missing, f"Expected files not found: {sorted(missing)}"
     
     @pytest.mark.unit
-    def test_get_docker_service_definition(self, mock_jinja_env, sample_project_context):
+    def test_get_docker_service_definition(self, mock_jinja_env, fresh_project_context):
         """Test Docker service definition for DLT."""
         generator = DLTGenerator(mock_jinja_env)
         
-        service = generator.get_docker_service_definition(sample_project_context)
+        service = generator.get_docker_service_definition(fresh_project_context)
         
         assert "dlt_ingestion" in service
         assert "build" in service["dlt_ingestion"]
         assert "environment" in service["dlt_ingestion"]
     
     @pytest.mark.unit
-    def test_get_env_vars(self, mock_jinja_env, sample_project_context):
+    def test_get_env_vars(self, mock_jinja_env, fresh_project_context):
         """Test environment variables for DLT."""
         generator = DLTGenerator(mock_jinja_env)
         
-        env_vars = generator.get_env_vars(sample_project_context)
+        env_vars = generator.get_env_vars(fresh_project_context)
         
         assert isinstance(env_vars, dict)
         assert len(env_vars) > 0
@@ -2,154 +2,110 @@
 Tests for Monitoring providers (Phase 3)
 """
 import pytest
-import os
 import json
-from jinja2 import Environment, FileSystemLoader
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
 
-@pytest.fixture
-def jinja_env():
-    """Create Jinja2 environment for template loading."""
-    template_dir = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-        "backend", "templates"
+
+MONITORING_TEMPLATES = [
+    "monitoring/prometheus_compose.yml.j2",
+    "monitoring/prometheus_config.yml.j2",
+    "monitoring/grafana_monitoring_dashboard.json.j2",
+    "monitoring/prometheus_alerts.yml.j2",
+]
+
+
+@pytest.fixture(scope="module")
+def grafana_dashboard(get_template):
+    """Render and parse the Grafana dashboard once for every check on it."""
+    template = get_template("monitoring/grafana_monitoring_dashboard.json.j2")
+    rendered = template.render(
+        project_name="test_monitoring",
+        stack={"storage": "PostgreSQL"}
     )
-    return Environment(loader=FileSystemLoader(template_dir))
+    if orjson is not None:
+        return orjson.loads(rendered)
+    return json.loads(rendered)
 
 
 class TestMonitoringTemplates:
     """Tests for monitoring Jinja2 templates."""
     
-    def test_prometheus_compose_template_exists(self):
-        """Test Prometheus compose template exists."""
-        template_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "backend", "templates", "monitoring", "prometheus_compose.yml.j2"
-        )
-        assert os.path.exists(template_path), "Prometheus compose template not found"
-    
-    def test_prometheus_config_template_exists(self):
-        """Test Prometheus config template exists."""
-        template_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "backend", "templates", "monitoring", "prometheus_config.yml.j2"
-        )
-        assert os.path.exists(template_path), "Prometheus config template not found"
-    
-    def test_grafana_dashboard_template_exists(self):
-        """Test Grafana dashboard template exists."""
-        template_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "backend", "templates", "monitoring", "grafana_monitoring_dashboard.json.j2"
-        )
-        assert os.path.exists(template_path), "Grafana dashboard template not found"
-    
-    def test_prometheus_alerts_template_exists(self):
-        """Test Prometheus alerts template exists."""
-        template_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "backend", "templates", "monitoring", "prometheus_alerts.yml.j2"
-        )
-        assert os.path.exists(template_path), "Prometheus alerts template not found"
+    @pytest.mark.parametrize("rel", MONITORING_TEMPLATES)
+    def test_template_exists(self, template_dir, rel):
+        """Test each monitoring template file exists."""
+        assert (template_dir / rel).is_file(), f"{rel} not found"
     
-    def test_prometheus_compose_syntax(self, jinja_env):
+    def test_prometheus_compose_syntax(self, get_template):
         """Test Prometheus compose template has valid syntax."""
-        try:
-            template = jinja_env.get_template("monitoring/prometheus_compose.yml.j2")
-            assert template is not None
-            
-            rendered = template.render(
-                project_name="test",
-                ports={"prometheus": 9090, "alertmanager": 9093},
-                stack={"storage": "PostgreSQL"},
-                secrets={}
-            )
-            assert "prometheus:" in rendered
-            assert "alertmanager:" in rendered
-            assert "node_exporter:" in rendered
-            assert "cadvisor:" in rendered
-        except Exception as e:
-            pytest.fail(f"Prometheus compose template error: {e}")
+        template = get_template("monitoring/prometheus_compose.yml.j2")
+        assert template is not None
+        
+        rendered = template.render(
+            project_name="test",
+            ports={"prometheus": 9090, "alertmanager": 9093},
+            stack={"storage": "PostgreSQL"},
+            secrets={}
+        )
+        assert "prometheus:" in rendered
+        assert "alertmanager:" in rendered
+        assert "node_exporter:" in rendered
+        assert "cadvisor:" in rendered
     
-    def test_prometheus_config_syntax(self, jinja_env):
+    def test_prometheus_config_syntax(self, get_template):
         """Test Prometheus config template has valid syntax."""
-        try:
-            template = jinja_env.get_template("monitoring/prometheus_config.yml.j2")
-            assert template is not None
-            
-            rendered = template.render(
-                project_name="test",
-                stack={"storage": "PostgreSQL", "orchestration": "Airflow"},
-                secrets={"airflow_admin_password": "test"}
-            )
-            assert "global:" in rendered
-            assert "scrape_configs:" in rendered
-            assert "job_name:" in rendered
-        except Exception as e:
-            pytest.fail(f"Prometheus config template error:{e}")
+        template = get_template("monitoring/prometheus_config.yml.j2")
+        assert template is not None
+        
+        rendered = template.render(
+            project_name="test",
+            stack={"storage": "PostgreSQL", "orchestration": "Airflow"},
+            secrets={"airflow_admin_password": "test"}
+        )
+        assert "global:" in rendered
+        assert "scrape_configs:" in rendered
+        assert "job_name:" in rendered
     
-    def test_grafana_dashboard_syntax(self, jinja_env):
+    def test_grafana_dashboard_syntax(self, grafana_dashboard):
         """Test Grafana dashboard template has valid syntax and JSON."""
-        try:
-            template = jinja_env.get_template("monitoring/grafana_monitoring_dashboard.json.j2")
-            assert template is not None
-            
-            rendered = template.render(
-                project_name="test_monitoring",
-                stack={"storage": "PostgreSQL"}
-            )
-            
-            # Verify it's valid JSON
-            dashboard_json = json.loads(rendered)
-            assert "panels" in dashboard_json
-            assert "title" in dashboard_json
-            assert dashboard_json["title"] == "test_monitoring - Infrastructure Monitoring"
-        except json.JSONDecodeError as e:
-            pytest.fail(f"Grafana dashboard is not valid JSON: {e}")
-        except Exception as e:
-            pytest.fail(f"Grafana dashboard template error: {e}")
+        assert "panels" in grafana_dashboard
+        assert "title" in grafana_dashboard
+        assert grafana_dashboard["title"] == "test_monitoring - Infrastructure Monitoring"
     
-    def test_prometheus_alerts_syntax(self, jinja_env):
+    def test_prometheus_alerts_syntax(self, get_template):
         """Test Prometheus alerts template has valid syntax."""
-        try:
-            template = jinja_env.get_template("monitoring/prometheus_alerts.yml.j2")
-            assert template is not None
-            
-            rendered = template.render(
-                project_name="test",
-                stack={"storage": "PostgreSQL", "orchestration": "Airflow"}
-            )
-            assert "groups:" in rendered
-            assert "alert:" in rendered
-            assert "expr:" in rendered
-        except Exception as e:
-            pytest.fail(f"Prometheus alerts template error: {e}")
-    
-    def test_prometheus_conditional_exporters(self, jinja_env):
-        """Test Prometheus compose includes conditional exporters."""
-        template = jinja_env.get_template("monitoring/prometheus_compose.yml.j2")
+        template = get_template("monitoring/prometheus_alerts.yml.j2")
+        assert template is not None
         
-        # With PostgreSQL
-        with_postgres = template.render(
+        rendered = template.render(
             project_name="test",
-            ports={"prometheus": 9090, "alertmanager": 9093},
-            stack={"storage": "PostgreSQL"},
-            secrets={"postgres_user": "u", "postgres_password": "p"}
+            stack={"storage": "PostgreSQL", "orchestration": "Airflow"}
         )
-        assert "postgres_exporter:" in with_postgres
-        
-        # Without PostgreSQL
-        without_postgres = template.render(
+        assert "groups:" in rendered
+        assert "alert:" in rendered
+        assert "expr:" in rendered
+    
+    @pytest.mark.parametrize("storage, secrets, expected", [
+        ("PostgreSQL", {"postgres_user": "u", "postgres_password": "p"}, True),
+        ("Snowflake", {}, False),
+    ], ids=["with-postgres", "without-postgres"])
+    def test_prometheus_conditional_exporters(self, get_template, storage, secrets, expected):
+        """Test Prometheus compose includes the Postgres exporter only with PostgreSQL."""
+        template = get_template("monitoring/prometheus_compose.yml.j2")
+        rendered = template.render(
             project_name="test",
             ports={"prometheus": 9090, "alertmanager": 9093},
-            stack={"storage": "Snowflake"},
-            secrets={}
+            stack={"storage": storage},
+            secrets=secrets
         )
-        assert "postgres_exporter:" not in without_postgres
+        assert ("postgres_exporter:" in rendered) is expected
     
-    def test_prometheus_scrape_configs_dynamic(self, jinja_env):
+    def test_prometheus_scrape_configs_dynamic(self, get_template):
         """Test Prometheus config has dynamic scrape targets."""
-        template = jinja_env.get_template("monitoring/prometheus_config.yml.j2")
+        template = get_template("monitoring/prometheus_config.yml.j2")
         
         rendered = template.render(
             project_name="test",
@@ -166,9 +122,9 @@ class TestMonitoringTemplates:
         assert "job_name: 'airflow'" in rendered
         assert "job_name: 'grafana'" in rendered
     
-    def test_prometheus_alerts_comprehensive(self, jinja_env):
+    def test_prometheus_alerts_comprehensive(self, get_template):
         """Test Prometheus alerts include all critical alerts."""
-        template = jinja_env.get_template("monitoring/prometheus_alerts.yml.j2")
+        template = get_template("monitoring/prometheus_alerts.yml.j2")
         
         rendered = template.render(
             project_name="test",
@@ -192,17 +148,9 @@ class TestMonitoringTemplates:
         # Disk space
         assert "DiskSpace" in rendered
     
-    def test_grafana_dashboard_panels(self, jinja_env):
+    def test_grafana_dashboard_panels(self, grafana_dashboard):
         """Test Grafana dashboard has required panels."""
-        template = jinja_env.get_template("monitoring/grafana_monitoring_dashboard.json.j2")
-        
-        rendered = template.render(
-            project_name="test",
-            stack={"storage": "PostgreSQL"}
-        )
-        
-        dashboard = json.loads(rendered)
-        panels = dashboard["panels"]
+        panels = grafana_dashboard["panels"]
         
         assert len(panels) >= 2, "Dashboard should have at least 2 panels"
         
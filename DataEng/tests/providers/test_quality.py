@@ -2,129 +2,83 @@
 Tests for Data Quality providers (Phase 3)
 """
 import pytest
-import os
-from jinja2 import Environment, FileSystemLoader
 
 
-@pytest.fixture
-def jinja_env():
-    """Create Jinja2 environment for template loading."""
-    template_dir = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-        "backend", "templates"
-    )
-    return Environment(loader=FileSystemLoader(template_dir))
+QUALITY_TEMPLATES = [
+    "quality/great_expectations_config.yml.j2",
+    "quality/great_expectations_suite.py.j2",
+    "quality/soda_checks.yml.j2",
+]
 
 
 class TestQualityTemplates:
     """Tests for data quality Jinja2 templates."""
     
-    def test_great_expectations_config_template_exists(self):
-        """Test Great Expectations config template exists."""
-        template_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "backend", "templates", "quality", "great_expectations_config.yml.j2"
-        )
-        assert os.path.exists(template_path), "Great Expectations config template not found"
-    
-    def test_great_expectations_suite_template_exists(self):
-        """Test Great Expectations suite template exists."""
-        template_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "backend", "templates", "quality", "great_expectations_suite.py.j2"
-        )
-        assert os.path.exists(template_path), "Great Expectations suite template not found"
+    @pytest.mark.parametrize("rel", QUALITY_TEMPLATES)
+    def test_template_exists(self, template_dir, rel):
+        """Test each quality template file exists."""
+        assert (template_dir / rel).is_file(), f"{rel} not found"
     
-    def test_soda_checks_template_exists(self):
-        """Test Soda checks template exists."""
-        template_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "backend", "templates", "quality", "soda_checks.yml.j2"
-        )
-        assert os.path.exists(template_path), "Soda checks template not found"
-    
-    def test_great_expectations_config_syntax(self, jinja_env):
+    def test_great_expectations_config_syntax(self, get_template):
         """Test Great Expectations config template has valid syntax."""
-        try:
-            template = jinja_env.get_template("quality/great_expectations_config.yml.j2")
-            assert template is not None
-            
-            # Test rendering with sample context
-            rendered = template.render(
-                project_name="test_project",
-                stack={"storage": "PostgreSQL"},
-                secrets={"postgres_user": "test", "postgres_password": "test"}
-            )
-            assert "config_version: 3.0" in rendered
-            assert "datasources:" in rendered
-        except Exception as e:
-            pytest.fail(f"Great Expectations config template error: {e}")
+        template = get_template("quality/great_expectations_config.yml.j2")
+        assert template is not None
+        
+        # Test rendering with sample context
+        rendered = template.render(
+            project_name="test_project",
+            stack={"storage": "PostgreSQL"},
+            secrets={"postgres_user": "test", "postgres_password": "test"}
+        )
+        assert "config_version: 3.0" in rendered
+        assert "datasources:" in rendered
     
-    def test_great_expectations_suite_syntax(self, jinja_env):
+    def test_great_expectations_suite_syntax(self, get_template):
         """Test Great Expectations suite template has valid syntax."""
-        try:
-            template = jinja_env.get_template("quality/great_expectations_suite.py.j2")
-            assert template is not None
-            
-            rendered = template.render(project_name="test_project")
-            assert "import great_expectations" in rendered
-            assert "def create_expectation_suite" in rendered
-        except Exception as e:
-            pytest.fail(f"Great Expectations suite template error: {e}")
+        template = get_template("quality/great_expectations_suite.py.j2")
+        assert template is not None
+        
+        rendered = template.render(project_name="test_project")
+        assert "import great_expectations" in rendered
+        assert "def create_expectation_suite" in rendered
     
-    def test_soda_checks_syntax(self, jinja_env):
+    def test_soda_checks_syntax(self, get_template):
         """Test Soda checks template has valid syntax."""
-        try:
-            template = jinja_env.get_template("quality/soda_checks.yml.j2")
-            assert template is not None
-            
-            # Test rendering with PostgreSQL
-            rendered = template.render(
-                project_name="test_project",
-                stack={"storage": "PostgreSQL"},
-                secrets={"postgres_user": "test", "postgres_password": "test"}
-            )
-            assert "data_source" in rendered
-            assert "checks for" in rendered
-        except Exception as e:
-            pytest.fail(f"Soda checks template error: {e}")
-    
-    def test_great_expectations_multi_storage_support(self, jinja_env):
-        """Test GE config supports multiple storage backends."""
-        template = jinja_env.get_template("quality/great_expectations_config.yml.j2")
+        template = get_template("quality/soda_checks.yml.j2")
+        assert template is not None
         
-        # Test PostgreSQL
-        postgres_render = template.render(
-            project_name="test",
+        # Test rendering with PostgreSQL
+        rendered = template.render(
+            project_name="test_project",
             stack={"storage": "PostgreSQL"},
-            secrets={"postgres_user": "u", "postgres_password": "p"}
+            secrets={"postgres_user": "test", "postgres_password": "test"}
         )
-        assert "postgresql://" in postgres_render
-        
-        # Test Snowflake
-        snowflake_render = template.render(
-            project_name="test",
-            stack={"storage": "Snowflake"},
-            secrets={
-                "snowflake_user": "u",
-                "snowflake_password": "p",
-                "snowflake_account": "acc",
-                "snowflake_warehouse": "wh"
-            }
-        )
-        assert "snowflake://" in snowflake_render
-        
-        # Test BigQuery
-        bigquery_render = template.render(
+        assert "data_source" in rendered
+        assert "checks for" in rendered
+    
+    @pytest.mark.parametrize("storage, secrets, needle", [
+        ("PostgreSQL", {"postgres_user": "u", "postgres_password": "p"}, "postgresql://"),
+        ("Snowflake", {
+            "snowflake_user": "u",
+            "snowflake_password": "p",
+            "snowflake_account": "acc",
+            "snowflake_warehouse": "wh"
+        }, "snowflake://"),
+        ("BigQuery", {"bigquery_project": "proj"}, "bigquery://"),
+    ], ids=["postgres", "snowflake", "bigquery"])
+    def test_great_expectations_multi_storage_support(self, get_template, storage, secrets, needle):
+        """Test GE config supports multiple storage backends."""
+        template = get_template("quality/great_expectations_config.yml.j2")
+        rendered = template.render(
             project_name="test",
-            stack={"storage": "BigQuery"},
-            secrets={"bigquery_project": "proj"}
+            stack={"storage": storage},
+            secrets=secrets
         )
-        assert "bigquery://" in bigquery_render
+        assert needle in rendered
     
-    def test_soda_checks_completeness(self, jinja_env):
+    def test_soda_checks_completeness(self, get_template):
         """Test Soda checks template includes all check types."""
-        template = jinja_env.get_template("quality/soda_checks.yml.j2")
+        template = get_template("quality/soda_checks.yml.j2")
         rendered = template.render(
             project_name="test",
             stack={"storage": "PostgreSQL"},
@@ -2,14 +2,12 @@
 Tests for Visualization providers (Phase 3)
 """
 import pytest
-import os
 from core.providers.visualization import (
     MetabaseGenerator,
     SupersetGenerator,
     GrafanaGenerator
 )
 from core.manifest import ProjectContext
-from jinja2 import Environment, FileSystemLoader
 
 
 @pytest.fixture
@@ -21,16 +19,6 @@ def project_context():
     )
 
 
-@pytest.fixture
-def jinja_env():
-    """Create Jinja2 environment for template loading."""
-    template_dir = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-        "backend", "templates"
-    )
-    return Environment(loader=FileSystemLoader(template_dir))
-
-
 class TestMetabaseGenerator:
     """Tests for Metabase generator."""
     
@@ -140,53 +128,32 @@ class TestGrafanaGenerator:
         assert "grafana_data" in volumes
 
 
+VISUALIZATION_TEMPLATES = [
+    "visualization/metabase_compose.yml.j2",
+    "visualization/superset_compose.yml.j2",
+    "visualization/grafana_compose.yml.j2",
+]
+
+
 class TestVisualizationTemplates:
     """Tests for visualization Jinja2 templates."""
     
-    def test_metabase_template_exists(self):
-        """Test Metabase template file exists."""
-        template_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "backend", "templates", "visualization", "metabase_compose.yml.j2"
-        )
-        assert os.path.exists(template_path), "Metabase template not found"
-    
-    def test_superset_template_exists(self):
-        """Test Superset template file exists."""
-        template_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "backend", "templates", "visualization", "superset_compose.yml.j2"
-        )
-        assert os.path.exists(template_path), "Superset template not found"
-    
-    def test_grafana_template_exists(self):
-        """Test Grafana template file exists."""
-        template_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-            "backend", "templates", "visualization", "grafana_compose.yml.j2"
-        )
-        assert os.path.exists(template_path), "Grafana template not found"
+    @pytest.mark.parametrize("rel", VISUALIZATION_TEMPLATES)
+    def test_template_exists(self, template_dir, rel):
+        """Test each visualization template file exists."""
+        assert (template_dir / rel).is_file(), f"{rel} not found"
     
-    def test_metabase_template_syntax(self, jinja_env):
+    def test_metabase_template_syntax(self, get_template):
         """Test Metabase template has valid Jinja2 syntax."""
-        try:
-            template = jinja_env.get_template("visualization/metabase_compose.yml.j2")
-            assert template is not None
-        except Exception as e:
-            pytest.fail(f"Metabase template syntax error: {e}")
+        template = get_template("visualization/metabase_compose.yml.j2")
+        assert template is not None
     
-    def test_superset_template_syntax(self, jinja_env):
+    def test_superset_template_syntax(self, get_template):
         """Test Superset template has valid Jinja2 syntax."""
-        try:
-            template = jinja_env.get_template("visualization/superset_compose.yml.j2")
-            assert template is not None
-        except Exception as e:
-            pytest.fail(f"Superset template syntax error: {e}")
+        template = get_template("visualization/superset_compose.yml.j2")
+        assert template is not None
     
-    def test_grafana_template_syntax(self, jinja_env):
+    def test_grafana_template_syntax(self, get_template):
         """Test Grafana template has valid Jinja2 syntax."""
-        try:
-            template = jinja_env.get_template("visualization/grafana_compose.yml.j2")
-            assert template is not None
-        except Exception as e:
-            pytest.fail(f"Grafana template syntax error: {e}")
+        template = get_template("visualization/grafana_compose.yml.j2")
+        assert template is not None
@@ -0,0 +1,3 @@
+"""
+System-level checks across registry, validator, context and VFS
+"""
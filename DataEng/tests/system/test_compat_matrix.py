@@ -0,0 +1,20 @@
+"""
+System checks for pairwise provider compatibility.
+"""
+
+import pytest
+from core.compatibility_matrix import is_compatible
+
+
+class TestCompatibilityPairs:
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("cat1,prov1,cat2,prov2,expected", [
+        ("ingestion", "DLT", "storage", "PostgreSQL", True),
+        ("transformation", "dbt", "storage", "Snowflake", True),
+        ("ingestion", "Kafka", "transformation", "dbt", False),
+        ("storage", "MongoDB", "transformation", "dbt", False),
+        ("transformation", "Spark", "storage", "MongoDB", True),
+    ])
+    def test_is_compatible(self, cat1, prov1, cat2, prov2, expected):
+        assert is_compatible(cat1, prov1, cat2, prov2) is expected
@@ -0,0 +1,56 @@
+"""
+System checks for ProjectContext secrets, ports and service discovery.
+"""
+
+import pytest
+from core.manifest import ServiceConnection
+
+
+@pytest.fixture
+def db_connection() -> ServiceConnection:
+    return ServiceConnection(
+        name="test_db",
+        type="postgres",
+        host="localhost",
+        port=5432,
+        env_prefix="DB_",
+        capabilities=["database", "sql_database"]
+    )
+
+
+class TestProjectContext:
+    
+    @pytest.mark.unit
+    def test_context_created(self, shared_project_context):
+        """ProjectContext se crea correctamente"""
+        assert shared_project_context.project_name == "test_project"
+    
+    @pytest.mark.unit
+    def test_generates_secrets(self, shared_project_context):
+        """ProjectContext genera secretos"""
+        secret = shared_project_context.get_or_create_secret("test_secret")
+        assert secret is not None and len(secret) > 0
+    
+    @pytest.mark.unit
+    def test_secrets_persist(self, shared_project_context):
+        """Secretos son persistentes"""
+        secret = shared_project_context.get_or_create_secret("test_secret")
+        assert shared_project_context.get_or_create_secret("test_secret") == secret
+    
+    @pytest.mark.unit
+    def test_assigns_ports(self, shared_project_context):
+        """ProjectContext asigna puertos"""
+        assert shared_project_context.get_service_port("test_service", 5432) == 5432
+    
+    @pytest.mark.unit
+    def test_registers_connection(self, fresh_project_context, db_connection):
+        """ProjectContext registra servicios"""
+        fresh_project_context.register_connection(db_connection)
+        assert len(fresh_project_context.connections) == 1
+    
+    @pytest.mark.unit
+    def test_service_discovery_by_capability(self, fresh_project_context, db_connection):
+        """Service discovery funciona"""
+        fresh_project_context.register_connection(db_connection)
+        db_service = fresh_project_context.get_service_by_capability("database")
+        assert db_service is not None and db_service.name == "test_db"
@@ -0,0 +1,45 @@
+"""
+System checks for the populated ProviderRegistry.
+"""
+
+import pytest
+from core.registry import ProviderRegistry
+
+
+CATEGORIES = [
+    "ingestion",
+    "storage",
+    "transformation",
+    "orchestration",
+    "infrastructure",
+    "visualization",
+    "quality",
+    "monitoring",
+]
+
+
+class TestRegistry:
+    """Registry is populated once the provider modules are imported."""
+    
+    @pytest.mark.unit
+    def test_registry_has_eight_categories(self, providers_loaded):
+        """ProviderRegistry tiene 8 categorías"""
+        assert len(ProviderRegistry.get_all_providers()) == 8
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("category", CATEGORIES)
+    def test_category_has_providers(self, providers_loaded, category):
+        """Cada categoría tiene providers"""
+        tools = ProviderRegistry.get_all_providers()[category]
+        assert len(tools) > 0, f"Found: {tools}"
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("category,provider", [
+        ("storage", "PostgreSQL"),
+        ("ingestion", "DLT"),
+        ("transformation", "dbt"),
+        ("orchestration", "Airflow"),
+    ])
+    def test_provider_registered(self, providers_loaded, category, provider):
+        """Providers específicos están registrados"""
+        assert provider in ProviderRegistry.get_all_providers().get(category, [])
@@ -0,0 +1,124 @@
+"""
+System checks for StackValidator on complete stacks and suggestions.
+"""
+
+import pytest
+from core.stack_validator import StackValidator
+
+
+STACKS = {
+    "modern_data": {
+        "ingestion": "DLT",
+        "storage": "PostgreSQL",
+        "transformation": "dbt",
+        "orchestration": "Airflow"
+    },
+    "kafka_dbt": {
+        "ingestion": "Kafka",
+        "transformation": "dbt"
+    },
+    "mongodb_dbt": {
+        "storage": "MongoDB",
+        "transformation": "dbt"
+    },
+    "mongodb_great_expectations": {
+        "storage": "MongoDB",
+        "quality": "Great Expectations"
+    },
+    "nosql": {
+        "storage": "MongoDB",
+        "transformation": "Spark",
+        "quality": "Soda"
+    },
+    "duckdb_superset": {
+        "storage": "DuckDB",
+        "visualization": "Superset"
+    },
+    "enterprise_cloud": {
+        "ingestion": "Airbyte",
+        "storage": "Snowflake",
+        "transformation": "dbt",
+        "orchestration": "Airflow",
+        "infrastructure": "Terraform",
+        "visualization": "Superset",
+        "quality": "Soda"
+    },
+    "streaming": {
+        "ingestion": "Kafka",
+        "storage": "PostgreSQL",
+        "transformation": "Spark",
+        "orchestration": "Airflow"
+    },
+    "full_stack": {
+        "ingestion": "DLT",
+        "storage": "PostgreSQL",
+        "transformation": "dbt",
+        "orchestration": "Airflow",
+        "infrastructure": "Terraform",
+        "visualization": "Metabase",
+        "quality": "Great Expectations",
+        "monitoring": "Prometheus"
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def results():
+    """Validates every stack once for all the checks in this module."""
+    return {name: StackValidator.validate_stack(stack) for name, stack in STACKS.items()}
+
+
+class TestStackValidation:
+    """Validation of complete stacks."""
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", [
+        "modern_data",
+        "nosql",
+        "enterprise_cloud",
+        "streaming",
+        "full_stack",
+    ])
+    def test_valid_stack(self, results, name):
+        """Stacks válidos no producen errores"""
+        is_valid, errors, warnings = results[name]
+        assert is_valid and len(errors) == 0, f"Errors: {errors}"
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", [
+        "kafka_dbt",
+        "mongodb_dbt",
+        "mongodb_great_expectations",
+    ])
+    def test_invalid_stack(self, results, name):
+        """Combinaciones incompatibles son marcadas como inválidas"""
+        is_valid, errors, warnings = results[name]
+        assert not is_valid, f"Should be invalid but got: {errors}"
+    
+    @pytest.mark.unit
+    @pytest.mark.xfail(
+        strict=True,
+        reason="compatibility_matrix omits Superset from DuckDB's compatible_visualization, "
+               "so the pair is rejected before StackValidator's DuckDB BI warning applies"
+    )
+    def test_duckdb_superset_warns_but_is_valid(self, results):
+        """DuckDB + Superset genera warning pero es válido"""
+        is_valid, errors, warnings = results["duckdb_superset"]
+        assert is_valid and len(warnings) > 0, f"Errors: {errors}"
+
+
+class TestSuggestions:
+    """Compatible-option suggestions for a partial stack."""
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("current,category,expected,excluded", [
+        ({"storage": "PostgreSQL"}, "transformation", ["dbt", "Spark"], []),
+        ({"storage": "MongoDB"}, "transformation", ["Spark"], ["dbt"]),
+        ({"storage": "MongoDB"}, "quality", ["Soda"], ["Great Expectations"]),
+    ])
+    def test_suggest_compatible_options(self, current, category, expected, excluded):
+        suggestions = StackValidator.suggest_compatible_options(current, category)
+        for provider in expected:
+            assert provider in suggestions
+        for provider in excluded:
+            assert provider not in suggestions
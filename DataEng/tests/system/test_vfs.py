@@ -0,0 +1,60 @@
+"""
+System checks for the in-memory VirtualFileSystem.
+"""
+
+import pytest
+
+
+class TestVirtualFileSystem:
+    
+    @pytest.mark.unit
+    def test_vfs_created(self, empty_vfs):
+        """VirtualFileSystem se crea correctamente"""
+        assert empty_vfs is not None
+        assert empty_vfs.list_files() == []
+    
+    @pytest.mark.unit
+    def test_vfs_accepts_files(self, empty_vfs):
+        """VFS acepta archivos"""
+        empty_vfs.add_file("README.md", "# Test Project")
+        assert "README.md" in empty_vfs.list_files()
+    
+    @pytest.mark.unit
+    def test_vfs_returns_content(self, empty_vfs):
+        """VFS retorna contenido correcto"""
+        empty_vfs.add_file("README.md", "# Test Project")
+        assert empty_vfs.get_file("README.md") == "# Test Project"
+    
+    @pytest.mark.unit
+    def test_vfs_multiple_files(self, empty_vfs):
+        """VFS maneja múltiples archivos"""
+        empty_vfs.add_file("README.md", "# Test Project")
+        empty_vfs.add_file("docker-compose.yml", "version: '3.8'")
+        empty_vfs.add_file(".env", "DB_HOST=localhost")
+        assert len(empty_vfs.list_files()) == 3
+    
+    @pytest.mark.unit
+    def test_vfs_add_files_in_bulk(self, empty_vfs):
+        """VFS acepta archivos en bloque"""
+        empty_vfs.add_files({
+            "README.md": "# Test Project",
+            ".env.dev": "DB_HOST=localhost",
+        })
+        assert empty_vfs.list_files() == ["README.md", ".env.dev"]
+    
+    @pytest.mark.unit
+    def test_vfs_contains_all(self, empty_vfs):
+        """VFS comprueba varias rutas de una vez"""
+        empty_vfs.add_files({"README.md": "", "docker-compose.yml": ""})
+        assert empty_vfs.contains_all(["README.md", "docker-compose.yml"])
+        assert empty_vfs.contains_all([])
+        assert not empty_vfs.contains_all(["README.md", "Makefile"])
+    
+    @pytest.mark.unit
+    def test_vfs_file_contains(self, empty_vfs):
+        """VFS busca texto dentro de un archivo"""
+        empty_vfs.add_file(".env.example", "POSTGRES_PASSWORD=\nAIRFLOW_UID=50000")
+        assert empty_vfs.file_contains(".env.example", "POSTGRES")
+        assert empty_vfs.file_contains(".env.example", "PWD", "AIRFLOW")
+        assert not empty_vfs.file_contains(".env.example", "KAFKA")
+        assert not empty_vfs.file_contains("missing.txt", "POSTGRES")
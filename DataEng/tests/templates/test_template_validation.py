@@ -6,34 +6,19 @@ Validates that all Jinja2 templates have correct syntax and can be rendered.
 """
 
 import pytest
-from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, TemplateSyntaxError, UndefinedError
+from jinja2 import TemplateSyntaxError, UndefinedError
 import yaml
 
 
 class TestTemplateValidation:
     """Test suite for template syntax validation"""
     
-    @pytest.fixture
-    def template_dir(self):
-        """Get templates directory"""
-        backend_dir = Path(__file__).parent.parent.parent / "backend"
-        return backend_dir / "templates"
-    
-    @pytest.fixture
-    def jinja_env(self, template_dir):
-        """Create Jinja2 environment"""
-        return Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=False
-        )
-    
     def test_templates_directory_exists(self, template_dir):
         """Verify templates directory exists"""
         assert template_dir.exists(), f"Templates directory not found: {template_dir}"
         assert template_dir.is_dir(), "Templates path is not a directory"
     
-    def test_all_templates_valid_jinja2_syntax(self, template_dir, jinja_env):
+    def test_all_templates_valid_jinja2_syntax(self, template_dir, get_template):
         """Validate all .j2 files have valid Jinja2 syntax"""
         template_files = list(template_dir.rglob("*.j2"))
         
@@ -43,7 +28,7 @@ class TestTemplateValidation:
         for template_file in template_files:
             try:
                 relative_path = template_file.relative_to(template_dir)
-                template = jinja_env.get_template(str(relative_path))
+                template = get_template(str(relative_path))
                 # Just loading is enough to validate syntax
             except TemplateSyntaxError as e:
                 errors.append(f"{template_file.name}: {str(e)}")
@@ -70,9 +55,9 @@ class TestTemplateValidation:
         if missing:
             pytest.fail(f"Required templates missing:\n" + "\n".join(missing))
     
-    def test_readme_template_renders(self, jinja_env):
+    def test_readme_template_renders(self, get_template):
         """Test README template can be rendered"""
-        template = jinja_env.get_template("common/README.md.j2")
+        template = get_template("common/README.md.j2")
         
         context = {
             "project_name": "test_project",
@@ -92,9 +77,9 @@ class TestTemplateValidation:
         assert len(result) > 0
         assert "test_project" in result
     
-    def test_docker_compose_template_renders_valid_yaml(self, jinja_env):
+    def test_docker_compose_template_renders_valid_yaml(self, get_template):
         """Test docker-compose template renders valid YAML"""
-        template = jinja_env.get_template("common/docker-compose.yml.j2")
+        template = get_template("common/docker-compose.yml.j2")
         
         context = {
             "project_name": "test_project",
@@ -120,9 +105,9 @@ class TestTemplateValidation:
         except yaml.YAMLError as e:
             pytest.fail(f"Invalid YAML generated: {e}")
     
-    def test_makefile_template_renders(self, jinja_env):
+    def test_makefile_template_renders(self, get_template):
         """Test Makefile template can be rendered"""
-        template = jinja_env.get_template("common/Makefile.j2")
+        template = get_template("common/Makefile.j2")
         
         context = {
             "project_name": "test_project",
@@ -134,9 +119,9 @@ class TestTemplateValidation:
         assert len(result) > 0
         assert "up:" in result or "build:" in result
     
-    def test_env_example_template_renders(self, jinja_env):
+    def test_env_example_template_renders(self, get_template):
         """Test .env.example template renders with all variables"""
-        template = jinja_env.get_template("common/env.example.j2")
+        template = get_template("common/env.example.j2")
         
         context = {
             "env_vars": {
@@ -223,20 +208,13 @@ class TestTemplateValidation:
 class TestTemplateRendering:
     """Test actual template rendering with realistic contexts"""
     
-    @pytest.fixture
-    def engine(self):
-        """Get template engine instance"""
-        from core.engine import TemplateEngine
-        return TemplateEngine()
-    
-    def test_full_stack_template_generation(self, engine):
+    def test_full_stack_template_generation(self, template_engine, project_id):
         """Test generating templates for a full stack"""
         from core.manifest import ProjectContext
-        import uuid
         
         context = ProjectContext(
             project_name="test_project",
-            project_id=str(uuid.uuid4()),
+            project_id=project_id,
             base_dir="/tmp/test"
         )
         
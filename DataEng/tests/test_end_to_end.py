@@ -0,0 +1,160 @@
+"""
+End-to-end generation suite.
+
+Every stack is generated once (module-scoped fixture) and then checked
+against each required file, so cases spread cleanly across workers:
+
+    pytest -n auto tests/test_end_to_end.py
+
+Set ANTIGRAVITY_VERBOSE=1 (with -s) to list the generated files.
+"""
+
+import os
+import re
+
+import pytest
+
+
+# Stacks whose generation is known to fail; strict, so a fix shows up as XPASS
+DBT_NO_WAREHOUSE = pytest.mark.xfail(
+    strict=True,
+    reason="Snowflake/DuckDB storage providers register no sql_database or "
+           "warehouse connection, so dbt's validate_configuration rejects the stack",
+)
+NONE_STACK_VALUE = pytest.mark.xfail(
+    strict=True,
+    reason="ProjectContext.stack is Dict[str, str]; a skipped category (None) "
+           "fails pydantic validation",
+)
+
+ALL_STACKS = [
+    pytest.param(("Modern_Data_Stack", {
+        "ingestion": "DLT",
+        "storage": "PostgreSQL",
+        "transformation": "dbt",
+        "orchestration": "Airflow"
+    }), id="Modern_Data_Stack"),
+    pytest.param(("Enterprise_Cloud", {
+        "ingestion": "Airbyte",
+        "storage": "Snowflake",
+        "transformation": "dbt",
+        "orchestration": "Airflow",
+        "infrastructure": "Terraform",
+        "visualization": "Superset"
+    }), id="Enterprise_Cloud", marks=DBT_NO_WAREHOUSE),
+    pytest.param(("Streaming_Stack", {
+        "ingestion": "Kafka",
+        "storage": "PostgreSQL",
+        "transformation": "Spark",
+        "orchestration": "Airflow"
+    }), id="Streaming_Stack"),
+    pytest.param(("NoSQL_Stack", {
+        "storage": "MongoDB",
+        "transformation": "Spark",
+        "quality": "Soda"
+    }), id="NoSQL_Stack"),
+    pytest.param(("Development_Stack", {
+        "storage": "DuckDB",
+        "transformation": "dbt"
+    }), id="Development_Stack", marks=DBT_NO_WAREHOUSE),
+    # Stack from the Python-native migration check: lowercase ids and an
+    # explicitly skipped category
+    pytest.param(("Python_Native_Migration", {
+        "ingestion": "dlt",
+        "storage": "postgres",
+        "transformation": "dbt",
+        "orchestration": "airflow",
+        "infrastructure": None
+    }), id="Python_Native_Migration", marks=NONE_STACK_VALUE),
+]
+
+REQUIRED_FILES = [
+    "README.md",
+    "docker-compose.yml",
+    ".gitignore",
+    "Makefile",
+    ".devcontainer/devcontainer.json",
+    "ARCHITECTURE.md",
+]
+
+# Content markers, matched in a single regex pass per file
+MARKERS = {
+    "dbt-run",
+    "airflow-init",
+    "make help",
+    ".PHONY: help",
+    "dbt-power-user",
+    "ms-python.python",
+}
+MARKER_PATTERN = re.compile("|".join(map(re.escape, sorted(MARKERS, key=len, reverse=True))))
+
+
+def find_markers(content):
+    """Return the subset of MARKERS present in content"""
+    return set(MARKER_PATTERN.findall(content))
+
+
+@pytest.fixture(scope="module", params=ALL_STACKS)
+def generated(request, template_engine):
+    """
+    Generates each stack once for every check on it.
+    
+    A failed generation is captured instead of raised, so it is re-raised
+    once by test_generation_succeeds with its traceback and the file checks
+    are skipped.
+    
+    Returns:
+        Tuple of (stack, vfs or None, exception or None)
+    """
+    stack_name, stack = request.param
+    try:
+        vfs = template_engine.generate(stack_name, stack, f"test-{stack_name}")
+    except Exception as exc:
+        return stack, None, exc
+    return stack, vfs, None
+
+
+def _require_vfs(generated):
+    stack, vfs, error = generated
+    if error is not None:
+        pytest.skip(f"generation failed: {error}")
+    return stack, vfs
+
+
+@pytest.mark.integration
+class TestEndToEnd:
+    """Generate every stack and check the resulting project."""
+
+    def test_generation_succeeds(self, generated):
+        stack, vfs, error = generated
+        if error is not None:
+            raise error
+        files = vfs.list_files()
+        assert files, "no files generated"
+        # File listing is for debugging only; generation order, no sort
+        if os.environ.get("ANTIGRAVITY_VERBOSE"):
+            for file_path in files:
+                print(f"  📄 {file_path}")
+
+    @pytest.mark.parametrize("required_file", REQUIRED_FILES)
+    def test_required_file(self, generated, required_file):
+        stack, vfs = _require_vfs(generated)
+        assert required_file in vfs.files
+
+    def test_env_files_generated(self, generated):
+        stack, vfs = _require_vfs(generated)
+        assert any(".env" in path for path in vfs.files)
+
+    def test_makefile_markers(self, generated):
+        stack, vfs = _require_vfs(generated)
+        found = find_markers(vfs.get_file("Makefile") or "")
+        assert "make help" in found or ".PHONY: help" in found
+        if stack.get("transformation") == "dbt":
+            assert "dbt-run" in found
+
+    def test_devcontainer_markers(self, generated):
+        stack, vfs = _require_vfs(generated)
+        found = find_markers(vfs.get_file(".devcontainer/devcontainer.json") or "")
+        assert "ms-python.python" in found
+        if stack.get("transformation") == "dbt":
+            assert "dbt-power-user" in found
@@ -3,11 +3,6 @@ Tests for Data Source Connectors
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add backend to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
 
 from core.providers.sources.auth import (
     NoAuth, APIKeyAuth, BearerTokenAuth, BasicAuth, OAuth2Auth
@@ -82,23 +77,19 @@ class TestAuthStrategies:
 class TestAPIConnector:
     """Test API Connector"""
     
-    def test_api_connector_init(self):
+    def test_api_connector_init(self, jinja_env):
         """Test APIConnector initialization"""
         from core.providers.sources.api_connector import APIConnector
-        from jinja2 import Environment, FileSystemLoader
         
-        env = Environment(loader=FileSystemLoader("backend/templates"))
-        connector = APIConnector(env)
+        connector = APIConnector(jinja_env)
         
         assert connector.get_source_type() == "api"
     
-    def test_create_auth_strategy(self):
+    def test_create_auth_strategy(self, jinja_env):
         """Test auth strategy factory"""
         from core.providers.sources.api_connector import APIConnector
-        from jinja2 import Environment, FileSystemLoader
         
-        env = Environment(loader=FileSystemLoader("backend/templates"))
-        connector = APIConnector(env)
+        connector = APIConnector(jinja_env)
         
         # Test creating NoAuth
         auth = connector._create_auth_strategy({"type": "none"})
@@ -116,13 +107,11 @@ class TestAPIConnector:
         auth = connector._create_auth_strategy({"type": "bearer"})
         assert isinstance(auth, BearerTokenAuth)
     
-    def test_extraction_dependencies(self):
+    def test_extraction_dependencies(self, jinja_env):
         """Test extraction dependencies"""
         from core.providers.sources.api_connector import APIConnector
-        from jinja2 import Environment, FileSystemLoader
         
-        env = Environment(loader=FileSystemLoader("backend/templates"))
-        connector = APIConnector(env)
+        connector = APIConnector(jinja_env)
         
         deps = connector.get_extraction_dependencies()
         